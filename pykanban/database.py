@@ -1,5 +1,6 @@
+import itertools
 import logging
-import uuid
+import os
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from dataclasses import dataclass
@@ -10,6 +11,9 @@ from PyQt6.QtSql import QSqlDatabase, QSqlError, QSqlQuery
 
 T = TypeVar("T", bound="DatabaseManager")
 
+# Process-wide source of unique QSqlDatabase connection names
+_conn_counter = itertools.count()
+
 # ==========================================================================================
 # ==========================================================================================
 
@@ -23,7 +27,7 @@ T = TypeVar("T", bound="DatabaseManager")
 # Insert Code here
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryResult:
     """Container for database query results
 
@@ -80,6 +84,37 @@ class DatabaseManager(ABC):
 
     # ------------------------------------------------------------------------------------------
 
+    @contextmanager
+    def transaction(self):
+        """Context manager running a block inside one transaction
+
+        Transactions begun inside the block join this one, so a block making
+        several writes commits them together.  The transaction is committed when
+        the block exits and rolled back if it raises.
+
+        Returns:
+            DatabaseManager: Database manager with an open transaction
+
+        Raises:
+            RuntimeError: If the transaction cannot be started or committed
+        """
+        with self.connection():
+            begin_result = self.begin_transaction()
+            if not begin_result.success:
+                raise RuntimeError(begin_result.message)
+            try:
+                yield self
+            except Exception:
+                self.rollback_transaction()
+                raise
+
+            commit_result = self.commit_transaction()
+            if not commit_result.success:
+                self.rollback_transaction()
+                raise RuntimeError(commit_result.message)
+
+    # ------------------------------------------------------------------------------------------
+
     @abstractmethod
     def open_db(self) -> QueryResult:
         """Open database connection
@@ -144,6 +179,24 @@ class DatabaseManager(ABC):
 
     # ------------------------------------------------------------------------------------------
 
+    @abstractmethod
+    def execute_batch(self, query: str, rows: list[tuple]) -> QueryResult:
+        """Execute one prepared statement once for every row of parameters
+
+        Args:
+            query (str): SQL query string
+            rows (list[tuple]): One parameter tuple per execution
+
+        Returns:
+            QueryResult:
+                success (bool): True if every row executed
+                data (Any): Query object if applicable
+                message (str): Description of result
+        """
+        pass
+
+    # ------------------------------------------------------------------------------------------
+
     @abstractmethod
     def table_schema(self, table_name: str) -> QueryResult:
         """Get schema for specified table
@@ -265,6 +318,28 @@ class DatabaseManager(ABC):
 # ==========================================================================================
 
 
+_AUTOCOMMIT_VERBS = ("SELECT", "INSERT", "UPDATE", "DELETE", "REPLACE")
+
+
+def _is_single_statement(query: str) -> bool:
+    """Determine if a query is a single statement that SQLite can autocommit
+
+    Args:
+        query (str): SQL query string
+
+    Returns:
+        bool: True if the query holds one SELECT or DML statement, False otherwise
+    """
+    statement = query.strip().rstrip(";")
+    if ";" in statement:
+        return False
+    return statement[:7].upper().startswith(_AUTOCOMMIT_VERBS)
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
 class DatabaseStatus(Enum):
     OPEN = "Database is open"
     CLOSED = "Database is closed"
@@ -279,9 +354,15 @@ class SQLiteManager(DatabaseManager):
     def __init__(self, db_name: str, connection_name: str = None, **kwargs):
         """Initialize database connection
 
+        The QSQLITE driver opens its handle in SQLite's multi-thread mode
+        (SQLITE_OPEN_NOMUTEX), so a SQLiteManager must only be used from the thread
+        that created it.  Threads that need database access should create their own
+        manager rather than share one.
+
         Args:
             db_name (str): Database name/path
-            connection_name: Name for connection, defaults to uuid
+            connection_name: Name for connection, defaults to a unique
+                             process-local name
             **kwargs: Additional database-specific connection parameters like:
                 hostname (str): Database server hostname
                 username (str): Database user
@@ -291,33 +372,48 @@ class SQLiteManager(DatabaseManager):
         super().__init__(db_name, **kwargs)
 
         if connection_name is None:
-            connection_name = str(uuid.uuid4())
+            connection_name = f"sqlite-{next(_conn_counter)}"
         self.connection_name = connection_name
         self.db_name = db_name
         self.con = QSqlDatabase.addDatabase("QSQLITE", connection_name)
         self.con.setDatabaseName(db_name)
 
+        # Mirrors self.con.isOpen() so query methods avoid a call into Qt
+        self._open = False
+        # Number of outstanding open_db calls; the connection closes when it hits zero
+        self._open_count = 0
+        # Nesting depth of begin_transaction calls, only the outermost reaches SQLite
+        self._tx_depth = 0
+        # Set when a nested transaction rolled back, so the outer one cannot commit
+        self._tx_rollback_only = False
+
     # ------------------------------------------------------------------------------------------
 
     def open_db(self) -> QueryResult:
         """Open database connection
 
+        Calls nest like a recursive lock: opening an already open connection
+        succeeds and must be paired with its own call to close_db.
+
         Returns:
             QueryResult:
                 success (bool): True if connection opened
                 data (None): No data returned
                 message (str): Description of result
         """
-        if self.con.isOpen():
+        if self._open:
+            self._open_count += 1
             return QueryResult(
-                False, DatabaseStatus.OPEN, f"{self.db_name} database is already open"
+                True, DatabaseStatus.OPEN, f"{self.db_name} database is already open"
             )
 
-        if not self.con.open():
+        if not self.con.isOpen() and not self.con.open():
             return QueryResult(
                 False, DatabaseStatus.ERROR, f"{self.db_name} database does not exist"
             )
 
+        self._open = True
+        self._open_count = 1
         return QueryResult(
             True, DatabaseStatus.OPEN, f"{self.db_name} database successfully opened"
         )
@@ -327,18 +423,31 @@ class SQLiteManager(DatabaseManager):
     def close_db(self) -> QueryResult:
         """Close database connection
 
+        The connection is only closed once every call to open_db has been matched
+        by a call to this method.
+
         Returns:
             QueryResult:
-                success (bool): True if connection closed
+                success (bool): True if connection closed or released
                 data (None): No data returned
                 message (str): Description of result
         """
-        if not self.con.isOpen():
+        if not self._open:
             return QueryResult(
                 False, DatabaseStatus.CLOSED, f"{self.db_name} database is not open"
             )
+
+        if self._open_count > 1:
+            self._open_count -= 1
+            return QueryResult(
+                True, DatabaseStatus.OPEN, f"{self.db_name} database is still in use"
+            )
+
         try:
             self.con.close()
+            self._open = False
+            self._open_count = 0
+            self._tx_depth = 0
         except Exception as e:
             return QueryResult(False, DatabaseStatus.ERROR, str(e))
 
@@ -361,7 +470,7 @@ class SQLiteManager(DatabaseManager):
                 data (Any): Query results if applicable
                 message (str): Description of result
         """
-        if not self.con.isOpen():
+        if not self._open:
             return QueryResult(
                 False, DatabaseStatus.CLOSED, f"{self.db_name} database not open"
             )
@@ -398,6 +507,11 @@ class SQLiteManager(DatabaseManager):
                 data (Any): Query results if applicable
                 message (str): Description of result
         """
+        # SQLite already wraps a lone statement in an implicit transaction, so an
+        # explicit BEGIN/COMMIT pair only adds round trips for the single-statement case
+        if _is_single_statement(query):
+            return self.execute_query(query, params)
+
         begin_result = self.begin_transaction()
         if not begin_result.success:
             return begin_result
@@ -416,6 +530,49 @@ class SQLiteManager(DatabaseManager):
 
     # ------------------------------------------------------------------------------------------
 
+    def execute_batch(self, query: str, rows: list[tuple]) -> QueryResult:
+        """Execute one prepared statement once for every row of parameters
+
+        The statement is prepared a single time and the parameters are bound
+        column-wise, so callers inserting many rows pay for one prepare and,
+        when wrapped in a transaction, a single commit.
+
+        Args:
+            query (str): SQL query string
+            rows (list[tuple]): One parameter tuple per execution
+
+        Returns:
+            QueryResult:
+                success (bool): True if every row executed
+                data (Any): Query object if applicable
+                message (str): Description of result
+        """
+        if not self._open:
+            return QueryResult(
+                False, DatabaseStatus.CLOSED, f"{self.db_name} database not open"
+            )
+
+        if not rows:
+            return QueryResult(True, None, "No rows to execute")
+
+        q = QSqlQuery(self.con)
+        q.prepare(query)
+
+        try:
+            for column in zip(*rows):
+                q.addBindValue(list(column))
+        except Exception as e:
+            return QueryResult(
+                False, DatabaseStatus.ERROR, f"Parameter binding failed: {str(e)}"
+            )
+
+        if not q.execBatch():
+            return QueryResult(False, DatabaseStatus.ERROR, q.lastError().text())
+
+        return QueryResult(True, q, "Batch executed successfully")
+
+    # ------------------------------------------------------------------------------------------
+
     def table_schema(self, table_name: str) -> QueryResult:
         """Get schema for specified table
 
@@ -428,7 +585,7 @@ class SQLiteManager(DatabaseManager):
                 data (dict): Column names and types
                 message (str): Description of result
         """
-        if not self.con.isOpen():
+        if not self._open:
             return QueryResult(
                 False, DatabaseStatus.CLOSED, f"{self.db_name} database is not open"
             )
@@ -465,7 +622,7 @@ class SQLiteManager(DatabaseManager):
                 data (dict): Tables, column names and types
                 message (str): Description of result
         """
-        if not self.con.isOpen():
+        if not self._open:
             return QueryResult(
                 False, DatabaseStatus.CLOSED, f"{self.db_name} database is not open"
             )
@@ -513,7 +670,7 @@ class SQLiteManager(DatabaseManager):
                 data (None): No data returned
                 message (str): Description of result
         """
-        if not self.con.isOpen():
+        if not self._open:
             return QueryResult(
                 False, DatabaseStatus.CLOSED, f"{self.db_name} database is not open"
             )
@@ -525,10 +682,7 @@ class SQLiteManager(DatabaseManager):
                 "Column names and data types lists must be of same length",
             )
 
-        column_query_parts = [
-            f"{name} {type}" for name, type in zip(column_names, data_types)
-        ]
-        column_query = ", ".join(column_query_parts)
+        column_query = ", ".join(map(" ".join, zip(column_names, data_types)))
         query_str = f"CREATE TABLE {table_name} ({column_query});"
 
         query = QSqlQuery(self.con)
@@ -557,7 +711,7 @@ class SQLiteManager(DatabaseManager):
                 data (DatabaseStatus): True if table exists
                 message (str): Description of result
         """
-        if not self.con.isOpen():
+        if not self._open:
             return QueryResult(
                 False, DatabaseStatus.CLOSED, f"{self.db_name} database is not open"
             )
@@ -585,29 +739,42 @@ class SQLiteManager(DatabaseManager):
 
     def remove_db(self) -> None:
         """Remove database and clean up resources"""
-        if self.con.isOpen():
+        if self._open:
+            # Release every outstanding open so the connection really closes
+            self._open_count = 1
             self.close_db()
-        QSqlDatabase.removeDatabase(self.con.connectionName())
+        # Release our handle first, Qt warns when removing a connection still in use
+        self.con = QSqlDatabase()
+        QSqlDatabase.removeDatabase(self.connection_name)
 
     # ------------------------------------------------------------------------------------------
 
     def begin_transaction(self) -> QueryResult:
         """Begin database transaction
 
+        Calls nest: beginning a transaction while one is open joins it, and the
+        matching commit or rollback only takes effect on the outermost one.
+
         Returns:
             QueryResult:
                 success (bool): True if transaction started
                 data (None): No data returned
                 message (str): Description of result
         """
-        if not self.con.isOpen():
+        if not self._open:
             return QueryResult(
                 False, DatabaseStatus.CLOSED, f"{self.db_name} database not open"
             )
 
+        if self._tx_depth:
+            self._tx_depth += 1
+            return QueryResult(True, DatabaseStatus.OPEN, "Joined open transaction")
+
         if not self.con.transaction():
             return QueryResult(False, DatabaseStatus.ERROR, "Failed to start transaction")
 
+        self._tx_depth = 1
+        self._tx_rollback_only = False
         return QueryResult(True, DatabaseStatus.OPEN, "Transaction started")
 
     # ------------------------------------------------------------------------------------------
@@ -621,16 +788,29 @@ class SQLiteManager(DatabaseManager):
                 data (None): No data returned
                 message (str): Description of result
         """
-        if not self.con.isOpen():
+        if not self._open:
             return QueryResult(
                 False, DatabaseStatus.CLOSED, f"{self.db_name} database not open"
             )
 
+        if self._tx_depth > 1:
+            self._tx_depth -= 1
+            return QueryResult(
+                True, DatabaseStatus.OPEN, "Commit deferred to enclosing transaction"
+            )
+
+        # A failed commit leaves the transaction open for the caller to roll back
+        if self._tx_rollback_only:
+            return QueryResult(
+                False, DatabaseStatus.ERROR, "Nested transaction was rolled back"
+            )
+
         if not self.con.commit():
             return QueryResult(
                 False, DatabaseStatus.ERROR, "Failed to commit transaction"
             )
 
+        self._tx_depth = 0
         return QueryResult(True, DatabaseStatus.OPEN, "Transaction committed")
 
     # ------------------------------------------------------------------------------------------
@@ -644,11 +824,20 @@ class SQLiteManager(DatabaseManager):
                 data (None): No data returned
                 message (str): Description of result
         """
-        if not self.con.isOpen():
+        if not self._open:
             return QueryResult(
                 False, DatabaseStatus.CLOSED, f"{self.db_name} database not open"
             )
 
+        if self._tx_depth > 1:
+            self._tx_depth -= 1
+            self._tx_rollback_only = True
+            return QueryResult(
+                True, DatabaseStatus.OPEN, "Enclosing transaction marked for rollback"
+            )
+
+        self._tx_depth = 0
+        self._tx_rollback_only = False
         if not self.con.rollback():
             return QueryResult(
                 False, DatabaseStatus.ERROR, "Failed to rollback transaction"
@@ -661,6 +850,18 @@ class SQLiteManager(DatabaseManager):
 # ==========================================================================================
 
 
+# Columns that always stay first and last and can be neither reordered nor deleted
+FIXED_COLUMNS = frozenset(("Ready to Start", "Complete"))
+
+# Connection settings applied once when a KanbanDatabaseManager opens its connection
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA cache_size=-20000;",
+)
+
+
 class KanbanDatabaseManager:
     """
     Class that implements Kanban-specific database operations using SQLiteManager
@@ -671,13 +872,74 @@ class KanbanDatabaseManager:
 
     def __init__(self, db_path: str, log: logging.Logger):
         self.db_path = db_path
+        # Resolved once so callers can compare files, symlinked aliases included
+        self.canonical_path = os.path.realpath(db_path)
         self.log = log
-        self.db_manager = SQLiteManager(db_path)
+        self._db_manager = SQLiteManager(db_path)
+        # Set by open(defer=True), the connection is opened on first use instead
+        self._open_deferred = False
+
+    # ------------------------------------------------------------------------------------------
+
+    @property
+    def db_manager(self) -> SQLiteManager:
+        """SQLiteManager the operations run on, opening a deferred connection first"""
+        if self._open_deferred:
+            self._open_deferred = False
+            self.open()
+        return self._db_manager
+
+    # ------------------------------------------------------------------------------------------
+
+    def open(self, defer: bool = False) -> QueryResult:
+        """Open a connection that stays open until close() is called
+
+        While it is held, the connection blocks of the individual operations nest
+        on it instead of reopening the file, and the connection settings in
+        _CONNECTION_PRAGMAS only need to be applied once.
+
+        Args:
+            defer: Postpone opening the file until the first operation that uses
+                   the database, so the caller's thread does no file I/O now
+
+        Returns:
+            QueryResult indicating success/failure of opening the database
+        """
+        if defer:
+            self._open_deferred = True
+            return QueryResult(
+                True, DatabaseStatus.CLOSED, "Opening deferred to first use"
+            )
+
+        result = self._db_manager.open_db()
+        if not result.success:
+            self.log.error("Failed to open database %s: %s", self.db_path, result.message)
+            return result
+
+        for pragma in _CONNECTION_PRAGMAS:
+            pragma_result = self._db_manager.execute_query(pragma)
+            if not pragma_result.success:
+                self.log.warning("Failed to apply %s: %s", pragma, pragma_result.message)
+
+        return result
+
+    # ------------------------------------------------------------------------------------------
+
+    def close(self) -> None:
+        """Close the connection and remove it, the manager cannot be used afterwards"""
+        self._open_deferred = False
+        self._db_manager.remove_db()
 
     # ------------------------------------------------------------------------------------------
 
     def initialize_database(self) -> QueryResult:
-        """Create initial schema for a new Kanban database with default columns"""
+        """Create initial schema for a new Kanban database with default columns
+
+        Returns:
+            QueryResult with the list of (name, order, number, column_color,
+            text_color) tuples for the default columns, in the same form as
+            fetch_board_snapshot
+        """
         create_table = """
         CREATE TABLE Columns (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -702,14 +964,16 @@ class KanbanDatabaseManager:
                 # Begin transaction for schema creation
                 begin_result = db.begin_transaction()
                 if not begin_result.success:
-                    self.log.error(f"Failed to begin transaction: {begin_result.message}")
+                    self.log.error(
+                        "Failed to begin transaction: %s", begin_result.message
+                    )
                     return begin_result
 
                 # Create the Columns table
                 table_result = db.execute_query(create_table)
                 if not table_result.success:
                     self.log.error(
-                        f"Failed to create Columns table: {table_result.message}"
+                        "Failed to create Columns table: %s", table_result.message
                     )
                     db.rollback_transaction()
                     return table_result
@@ -717,7 +981,7 @@ class KanbanDatabaseManager:
                 # Create the unique index
                 index_result = db.execute_query(create_index)
                 if not index_result.success:
-                    self.log.error(f"Failed to create index: {index_result.message}")
+                    self.log.error("Failed to create index: %s", index_result.message)
                     db.rollback_transaction()
                     return index_result
 
@@ -733,22 +997,20 @@ class KanbanDatabaseManager:
                 VALUES (?, ?, 0, ?, ?);
                 """
 
-                for name, order, column_color, text_color in default_columns:
-                    column_result = db.execute_query(
-                        insert_query, (name, order, column_color, text_color)
+                # Prepared once and bound for every default column
+                column_result = db.execute_batch(insert_query, default_columns)
+                if not column_result.success:
+                    self.log.error(
+                        "Failed to create default columns: %s", column_result.message
                     )
-                    if not column_result.success:
-                        self.log.error(
-                            f"Failed to create col {name}: {column_result.message}"
-                        )
-                        db.rollback_transaction()
-                        return column_result
+                    db.rollback_transaction()
+                    return column_result
 
                 # Commit the changes
                 commit_result = db.commit_transaction()
                 if not commit_result.success:
                     self.log.error(
-                        f"Failed to commit transaction: {commit_result.message}"
+                        "Failed to commit transaction: %s", commit_result.message
                     )
                     db.rollback_transaction()
                     return commit_result
@@ -756,13 +1018,17 @@ class KanbanDatabaseManager:
                 self.log.info(
                     "Successfully initialized Kanban database schema with default columns"
                 )
+                columns = [
+                    (name, order, 0, column_color, text_color)
+                    for name, order, column_color, text_color in default_columns
+                ]
                 return QueryResult(
-                    True, None, "Kanban database schema created successfully"
+                    True, columns, "Kanban database schema created successfully"
                 )
 
             except Exception as e:
                 db.rollback_transaction()
-                self.log.error(f"Unexpected error initializing database: {str(e)}")
+                self.log.error("Unexpected error initializing database: %s", e)
                 return QueryResult(
                     False, None, f"Failed to create database schema: {str(e)}"
                 )
@@ -785,7 +1051,7 @@ class KanbanDatabaseManager:
             text_color: Color of the column header text (defaults to black)
 
         Returns:
-            QueryResult indicating success/failure
+            QueryResult with the inserted (id, name, order) row as data
         """
         if not name:
             return QueryResult(False, None, "Column name cannot be empty")
@@ -800,7 +1066,9 @@ class KanbanDatabaseManager:
                 # Begin transaction
                 begin_result = db.begin_transaction()
                 if not begin_result.success:
-                    self.log.error(f"Failed to begin transaction: {begin_result.message}")
+                    self.log.error(
+                        "Failed to begin transaction: %s", begin_result.message
+                    )
                     return begin_result
 
                 # Insert the new column
@@ -809,34 +1077,39 @@ class KanbanDatabaseManager:
                 )
                 if not query_result.success:
                     self.log.error(
-                        f"Failed to create column {name}: {query_result.message}"
+                        "Failed to create column %s: %s", name, query_result.message
                     )
                     db.rollback_transaction()
                     return query_result
 
                 # Get the ID of the newly inserted column
+                column_id = None
                 id_query = "SELECT last_insert_rowid() as id;"
                 id_result = db.execute_query(id_query)
                 if id_result.success:
                     id_result.data.next()
                     column_id = id_result.data.value("id")
-                    self.log.info(f"Created column {name} with ID {column_id}")
+                    self.log.info("Created column %s with ID %s", name, column_id)
 
                 # Commit the changes
                 commit_result = db.commit_transaction()
                 if not commit_result.success:
                     self.log.error(
-                        f"Failed to commit transaction: {commit_result.message}"
+                        "Failed to commit transaction: %s", commit_result.message
                     )
                     db.rollback_transaction()
                     return commit_result
 
-                self.log.info(f"Successfully created column: {name} at position {order}")
-                return QueryResult(True, None, f"Column {name} created successfully")
+                self.log.info(
+                    "Successfully created column: %s at position %s", name, order
+                )
+                return QueryResult(
+                    True, (column_id, name, order), f"Column {name} created successfully"
+                )
 
             except Exception as e:
                 db.rollback_transaction()
-                self.log.error(f"Unexpected error creating column: {str(e)}")
+                self.log.error("Unexpected error creating column: %s", e)
                 return QueryResult(False, None, f"Failed to create column: {str(e)}")
 
     # ------------------------------------------------------------------------------------------
@@ -852,7 +1125,7 @@ class KanbanDatabaseManager:
             QueryResult indicating success/failure
         """
         # Don't allow reordering of fixed columns
-        if column_name in ["Ready to Start", "Complete"]:
+        if column_name in FIXED_COLUMNS:
             return QueryResult(False, None, f"Cannot reorder fixed column: {column_name}")
 
         # Get current max order
@@ -912,6 +1185,49 @@ class KanbanDatabaseManager:
 
     # ------------------------------------------------------------------------------------------
 
+    def fetch_board_snapshot(self) -> QueryResult:
+        """Read everything needed to draw the board in a single query
+
+        Returns:
+            QueryResult with list of (name, order, number, column_color, text_color)
+            tuples ordered by column order, only including non-deleted columns
+        """
+        query = """
+        SELECT Name, "Order", Number, ColumnColor, TextColor
+        FROM Columns
+        WHERE deletion_date IS NULL
+        ORDER BY "Order";
+        """
+
+        with self.db_manager.connection() as db:
+            try:
+                result = db.execute_query(query)
+                if not result.success:
+                    return result
+
+                snapshot = []
+                query_result = result.data
+                while query_result.next():
+                    snapshot.append(
+                        (
+                            query_result.value(0),
+                            query_result.value(1),
+                            query_result.value(2),
+                            query_result.value(3),
+                            query_result.value(4),
+                        )
+                    )
+
+                self.log.info("Read board snapshot of %d columns", len(snapshot))
+                return QueryResult(True, snapshot, "Board snapshot read successfully")
+
+            except Exception as e:
+                error_msg = f"Failed to read board snapshot: {str(e)}"
+                self.log.error(error_msg)
+                return QueryResult(False, None, error_msg)
+
+    # ------------------------------------------------------------------------------------------
+
     def load_columns(self) -> QueryResult:
         """Load all active columns from the database
 
@@ -941,7 +1257,7 @@ class KanbanDatabaseManager:
                     text_color = query_result.value("TextColor")
                     columns.append((name, number, column_color, text_color))
 
-                self.log.info(f"Successfully loaded {len(columns)} active columns")
+                self.log.info("Successfully loaded %d active columns", len(columns))
                 return QueryResult(True, columns, "Columns loaded successfully")
 
             except Exception as e:
@@ -978,14 +1294,16 @@ class KanbanDatabaseManager:
                 # Begin transaction
                 begin_result = db.begin_transaction()
                 if not begin_result.success:
-                    self.log.error(f"Failed to begin transaction: {begin_result.message}")
+                    self.log.error(
+                        "Failed to begin transaction: %s", begin_result.message
+                    )
                     return begin_result
 
                 # Update the color
                 query_result = db.execute_query(update_query, (color, column_name))
                 if not query_result.success:
                     self.log.error(
-                        f"Failed to update column color: {query_result.message}"
+                        "Failed to update column color: %s", query_result.message
                     )
                     db.rollback_transaction()
                     return query_result
@@ -994,19 +1312,19 @@ class KanbanDatabaseManager:
                 commit_result = db.commit_transaction()
                 if not commit_result.success:
                     self.log.error(
-                        f"Failed to commit transaction: {commit_result.message}"
+                        "Failed to commit transaction: %s", commit_result.message
                     )
                     db.rollback_transaction()
                     return commit_result
 
                 self.log.info(
-                    f"Successfully updated {color_type} for column: {column_name}"
+                    "Successfully updated %s for column: %s", color_type, column_name
                 )
                 return QueryResult(True, None, "Column color updated successfully")
 
             except Exception as e:
                 db.rollback_transaction()
-                self.log.error(f"Unexpected error updating column color: {str(e)}")
+                self.log.error("Unexpected error updating column color: %s", e)
                 return QueryResult(
                     False, None, f"Failed to update column color: {str(e)}"
                 )
@@ -1038,7 +1356,7 @@ class KanbanDatabaseManager:
                 if not max_order:  # No columns exist
                     max_order = 0
 
-                self.log.debug(f"Current maximum order value: {max_order}")
+                self.log.debug("Current maximum order value: %s", max_order)
                 return QueryResult(
                     True, max_order, "Maximum order retrieved successfully"
                 )
@@ -1050,68 +1368,117 @@ class KanbanDatabaseManager:
 
     # ------------------------------------------------------------------------------------------
 
-    def get_order_for_new_column(self) -> QueryResult:
-        """Get the appropriate order value for a new column
+    def create_column_atomic(
+        self,
+        name: str,
+        column_color: str = "#b8daff",
+        text_color: str = "#000000",
+    ) -> QueryResult:
+        """Create a single column just before the 'Complete' column
+
+        Convenience wrapper around create_columns_atomic for the common one
+        column case.
+
+        Args:
+            name: Name of the column
+            column_color: Color of the column header background (defaults to light blue)
+            text_color: Color of the column header text (defaults to black)
+
+        Returns:
+            QueryResult with the order assigned to the new column as data
+        """
+        result = self.create_columns_atomic([name], column_color, text_color)
+        if result.success:
+            return QueryResult(True, result.data[0], result.message)
+        return result
+
+    # ------------------------------------------------------------------------------------------
 
-        Places new columns before the 'Complete' column, which should always be last.
-        'Ready to Start' should always be first (order=1).
+    def create_columns_atomic(
+        self,
+        names: list[str],
+        column_color: str = "#b8daff",
+        text_color: str = "#000000",
+    ) -> QueryResult:
+        """Create columns just before the 'Complete' column in one transaction
+
+        Looking up the 'Complete' column, shifting it right and inserting the new
+        columns all happen under a single BEGIN/COMMIT, so creating any number of
+        columns costs one commit rather than one per statement.
+
+        Args:
+            names: Names of the columns, in the order they should appear
+            column_color: Color of the column header background (defaults to light blue)
+            text_color: Color of the column header text (defaults to black)
 
         Returns:
-            QueryResult with the new order value as data
+            QueryResult with the list of orders assigned to the new columns as data
+        """
+        if not names or not all(names):
+            return QueryResult(False, None, "Column name cannot be empty")
+
+        find_query = """
+        SELECT "Order"
+        FROM Columns
+        WHERE Name = 'Complete' AND deletion_date IS NULL;
         """
+
+        update_query = """
+        UPDATE Columns
+        SET "Order" = "Order" + ?
+        WHERE Name = 'Complete';
+        """
+
+        insert_query = """
+        INSERT INTO Columns (Name, "Order", Number, ColumnColor, TextColor)
+        VALUES (?, ?, 0, ?, ?);
+        """
+
         with self.db_manager.connection() as db:
             try:
-                # Begin transaction
                 begin_result = db.begin_transaction()
                 if not begin_result.success:
                     return begin_result
 
-                # First get the Complete column's current order
-                find_query = """
-                SELECT "Order"
-                FROM Columns
-                WHERE Name = 'Complete' AND deletion_date IS NULL;
-                """
-
                 result = db.execute_query(find_query)
                 if not result.success:
                     db.rollback_transaction()
                     return result
 
-                query_result = result.data
-                if not query_result.next():
+                if not result.data.next():
                     db.rollback_transaction()
                     self.log.error("Could not find 'Complete' column")
                     return QueryResult(False, None, "Complete column not found")
 
-                complete_order = query_result.value("Order")
-
-                # Update Complete column's order
-                update_query = """
-                UPDATE Columns
-                SET "Order" = "Order" + 1
-                WHERE Name = 'Complete';
-                """
+                complete_order = result.data.value("Order")
+                orders = list(range(complete_order, complete_order + len(names)))
 
-                update_result = db.execute_query(update_query)
+                update_result = db.execute_query(update_query, (len(names),))
                 if not update_result.success:
                     db.rollback_transaction()
                     return update_result
 
-                # Commit the changes
+                rows = [
+                    (name, order, column_color, text_color)
+                    for name, order in zip(names, orders)
+                ]
+                insert_result = db.execute_batch(insert_query, rows)
+                if not insert_result.success:
+                    self.log.error("Failed to create columns: %s", insert_result.message)
+                    db.rollback_transaction()
+                    return insert_result
+
                 commit_result = db.commit_transaction()
                 if not commit_result.success:
                     db.rollback_transaction()
                     return commit_result
 
-                # Return the order value that the new column should use
-                return QueryResult(
-                    True, complete_order, "Order value retrieved successfully"
-                )
+                self.log.info("Created columns %s at positions %s", names, orders)
+                return QueryResult(True, orders, "Columns created successfully")
 
             except Exception as e:
                 db.rollback_transaction()
-                error_msg = f"Failed to get order for new column: {str(e)}"
+                error_msg = f"Failed to create columns: {str(e)}"
                 self.log.error(error_msg)
                 return QueryResult(False, None, error_msg)
 
@@ -1128,7 +1495,7 @@ class KanbanDatabaseManager:
         Returns:
             QueryResult indicating success/failure
         """
-        if column_name in ["Ready to Start", "Complete"]:
+        if column_name in FIXED_COLUMNS:
             return QueryResult(False, None, "Cannot delete fixed columns")
 
         with self.db_manager.connection() as db:
@@ -1189,7 +1556,7 @@ class KanbanDatabaseManager:
                     db.rollback_transaction()
                     return commit_result
 
-                self.log.info(f"Successfully soft deleted column: {column_name}")
+                self.log.info("Successfully soft deleted column: %s", column_name)
                 return QueryResult(True, None, "Column deleted successfully")
 
             except Exception as e:
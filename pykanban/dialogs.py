@@ -1,6 +1,10 @@
 import logging
 import os
+import time
+from collections import OrderedDict
+from functools import lru_cache
 
+from PyQt6.QtCore import QStringListModel
 from PyQt6.QtWidgets import (
     QComboBox,
     QDialog,
@@ -23,8 +27,124 @@ from PyQt6.QtWidgets import (
 # ==========================================================================================
 # ==========================================================================================
 
+# Seconds that a cached existence check stays valid
+STAT_CACHE_TTL = 2.0
 
-class NewDatabaseDialog(QDialog):
+
+@lru_cache(maxsize=128)
+def _cached_exists(path: str, bucket: int) -> bool:
+    """Cached os.path.exists, where bucket is the TTL window the lookup falls in"""
+    return os.path.exists(path)
+
+
+def path_exists(path: str) -> bool:
+    """Check if a path exists, reusing results for up to STAT_CACHE_TTL seconds
+
+    Args:
+        path: File system path to check
+
+    Returns:
+        bool: True if the path exists, False otherwise
+    """
+    bucket = int(time.monotonic() / STAT_CACHE_TTL)
+    return _cached_exists(os.path.normpath(path), bucket)
+
+
+def clear_path_cache() -> None:
+    """Discard cached existence checks after a file is created or deleted"""
+    _cached_exists.cache_clear()
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+class LazyDialog(QDialog):
+    """Dialog that defers building its widgets until it is first shown
+
+    Subclasses implement _setup_ui, which runs once just before the dialog becomes
+    visible for the first time, so constructing a dialog that is never shown does
+    not pay for its widget tree.
+    """
+
+    def __init__(self, parent=None):
+        """Initialize the dialog without building its user interface
+
+        Args:
+            parent: Parent widget for this dialog
+        """
+        super().__init__(parent)
+        self._ui_built = False
+
+    # ------------------------------------------------------------------------------------------
+
+    def setVisible(self, visible: bool):
+        """Build the user interface before the dialog is shown for the first time
+
+        Building here rather than in showEvent lets Qt size and position the
+        dialog around the finished layout.
+
+        Args:
+            visible: True if the dialog is being shown, False if hidden
+        """
+        if visible and not self._ui_built:
+            self._ui_built = True
+            self._setup_ui()
+        super().setVisible(visible)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _setup_ui(self):
+        """Initialize the dialog's user interface, overridden by each subclass"""
+        pass
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+class DatabaseSelectionDialog(LazyDialog):
+    """Dialog that lets the user browse for an existing database file
+
+    A single QFileDialog is created on first use and kept for the lifetime of the
+    dialog, so its directory, history and file system cache carry over between
+    clicks of the Browse button.
+    """
+
+    def __init__(self, parent=None):
+        """Initialize the dialog without creating the file dialog
+
+        Args:
+            parent: Parent widget for this dialog
+        """
+        super().__init__(parent)
+        self._file_dialog = None
+
+    # ------------------------------------------------------------------------------------------
+
+    def _select_database_file(self) -> str:
+        """Show the file dialog and return the chosen database file
+
+        Returns:
+            str: Path to the selected file, or an empty string if cancelled
+        """
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(
+                self, "Select Database", "", "SQLite Database (*.db)"
+            )
+            self._file_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+
+        if self._file_dialog.exec() != QDialog.DialogCode.Accepted:
+            return ""
+        selected = self._file_dialog.selectedFiles()
+        return selected[0] if selected else ""
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+class NewDatabaseDialog(LazyDialog):
     """Dialog for creating a new database file with location selection"""
 
     def __init__(self, log: logging.Logger, parent=None):
@@ -37,7 +157,6 @@ class NewDatabaseDialog(QDialog):
         self.log = log
         self.selected_path = ""
         self.database_name = ""
-        self._setup_ui()
         self.log.info("Initialized NewDatabaseDialog")
 
     # ------------------------------------------------------------------------------------------
@@ -120,7 +239,7 @@ class NewDatabaseDialog(QDialog):
         if directory:
             self.selected_path = directory
             self.path_edit.setText(directory)
-            self.log.info(f"User selected directory: {directory}")
+            self.log.info("User selected directory: %s", directory)
 
     # ------------------------------------------------------------------------------------------
 
@@ -133,8 +252,8 @@ class NewDatabaseDialog(QDialog):
         Returns:
             Cleaned database name without .db suffix
         """
-        # First remove any .db suffix
-        if name.lower().endswith(".db"):
+        # First remove any .db suffix, lowercasing only the tail being compared
+        if name[-3:].lower() == ".db":
             name = name[:-3]
 
         # Remove any leading/trailing whitespace
@@ -167,7 +286,7 @@ class NewDatabaseDialog(QDialog):
             return
 
         if not name.replace("_", "").replace("-", "").isalnum():
-            self.log.warning(f"Database creation failed: Invalid name format: {name}")
+            self.log.warning("Database creation failed: Invalid name format: %s", name)
             QMessageBox.warning(
                 self,
                 "Invalid Name",
@@ -178,7 +297,7 @@ class NewDatabaseDialog(QDialog):
 
         db_path = os.path.join(path, f"{name}.db")
         if os.path.exists(db_path):
-            self.log.warning(f"Database creation failed: Path already exists: {db_path}")
+            self.log.warning("Database creation failed: Path already exists: %s", db_path)
             QMessageBox.warning(
                 self,
                 "Database Exists",
@@ -191,7 +310,7 @@ class NewDatabaseDialog(QDialog):
 
         self.database_name = name
         self.selected_path = path
-        self.log.info(f"Database creation dialog validated successfully for: {db_path}")
+        self.log.info("Database creation dialog validated successfully for: %s", db_path)
         self.accept()
 
 
@@ -199,7 +318,7 @@ class NewDatabaseDialog(QDialog):
 # ==========================================================================================
 
 
-class DeleteDatabaseDialog(QDialog):
+class DeleteDatabaseDialog(DatabaseSelectionDialog):
     """
     A dialog window for selecting and deleting an existing database file.
     This dialog provides a user interface with file selection, confirmation
@@ -233,7 +352,6 @@ class DeleteDatabaseDialog(QDialog):
         super().__init__(parent)
         self.log = log
         self.selected_path = ""
-        self._setup_ui()
         self.log.info("Initialized DeleteDatabaseDialog")
 
     # ------------------------------------------------------------------------------------------
@@ -296,17 +414,12 @@ class DeleteDatabaseDialog(QDialog):
     def _browse_database(self):
         """Open file dialog to select an existing database"""
         self.log.debug("Opening database selection dialog")
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select Database",
-            "",
-            "SQLite Database (*.db)",
-        )
+        file_path = self._select_database_file()
         if file_path:
             self.selected_path = file_path
             self.path_edit.setText(file_path)
             self.delete_button.setEnabled(True)
-            self.log.info(f"User selected database: {file_path}")
+            self.log.info("User selected database: %s", file_path)
 
     # ------------------------------------------------------------------------------------------
 
@@ -332,12 +445,14 @@ class DeleteDatabaseDialog(QDialog):
 # ==========================================================================================
 
 
-class OpenDatabaseDialog(QDialog):
+class OpenDatabaseDialog(DatabaseSelectionDialog):
     """Dialog for opening an existing database file
 
     Provides a user interface for selecting and validating a .db file.
     """
 
+    MAX_REJECTED_PATHS = 64
+
     def __init__(self, log: logging.Logger, parent=None):
         """Initialize the open database dialog
 
@@ -348,7 +463,9 @@ class OpenDatabaseDialog(QDialog):
         super().__init__(parent)
         self.log = log
         self.selected_path = ""
-        self._setup_ui()
+        # Recently selected paths without a .db extension, oldest first, bounded to
+        # MAX_REJECTED_PATHS.  Missing files are not kept, since they may reappear
+        self._negative_paths: OrderedDict[str, None] = OrderedDict()
         self.log.info("Initialized OpenDatabaseDialog")
 
     # ------------------------------------------------------------------------------------------
@@ -408,24 +525,48 @@ class OpenDatabaseDialog(QDialog):
     def _browse_database(self):
         """Open file dialog to select an existing database"""
         self.log.debug("Opening database selection dialog")
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select Database", "", "SQLite Database (*.db)"
-        )
+        file_path = self._select_database_file()
 
         if file_path:
-            if file_path.lower().endswith(".db"):
+            # Normalize once so the stored path and cache keys always agree
+            file_path = os.path.normpath(file_path)
+
+            # A file rejected before is warned about again without validating it
+            if file_path in self._negative_paths:
+                self._negative_paths.move_to_end(file_path)
+            elif os.path.splitext(file_path)[1].lower() == ".db":
+                self._negative_paths.clear()
                 self.selected_path = file_path
                 self.path_edit.setText(file_path)
                 self.open_button.setEnabled(True)
-                self.log.info(f"User selected database: {file_path}")
+                self.log.info("User selected database: %s", file_path)
+                return
             else:
-                self.log.warning(f"Invalid file selected: {file_path}")
-                QMessageBox.warning(
-                    self,
-                    "Invalid File Type",
-                    "Please select a valid SQLite database file (*.db)",
-                )
-                self.open_button.setEnabled(False)
+                self._reject_path(file_path)
+
+            self.log.warning("Invalid file selected: %s", file_path)
+            QMessageBox.warning(
+                self,
+                "Invalid File Type",
+                "Please select a valid SQLite database file (*.db)",
+            )
+            self.open_button.setEnabled(False)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _reject_path(self, file_path: str):
+        """Remember a selection with the wrong extension, evicting the oldest entry
+
+        Only extension failures are kept: they cannot change for a given path,
+        whereas a missing file may be restored later.
+
+        Args:
+            file_path: Path the user selected that failed validation
+        """
+        self._negative_paths[file_path] = None
+        self._negative_paths.move_to_end(file_path)
+        if len(self._negative_paths) > self.MAX_REJECTED_PATHS:
+            self._negative_paths.popitem(last=False)
 
     # ==========================================================================================
 
@@ -438,14 +579,17 @@ class OpenDatabaseDialog(QDialog):
             )
             return
 
+        # Check the file itself rather than the cache, which may still report a
+        # file deleted in the last STAT_CACHE_TTL seconds, and SQLite would quietly
+        # create an empty database in its place
         if not os.path.exists(self.selected_path):
-            self.log.warning(f"Selected database does not exist: {self.selected_path}")
+            self.log.warning("Selected database does not exist: %s", self.selected_path)
             QMessageBox.warning(
                 self, "File Not Found", "The selected database file no longer exists."
             )
             return
 
-        self.log.info(f"Database selection validated: {self.selected_path}")
+        self.log.info("Database selection validated: %s", self.selected_path)
         self.accept()
 
 
@@ -453,7 +597,7 @@ class OpenDatabaseDialog(QDialog):
 # ==========================================================================================
 
 
-class NewColumnDialog(QDialog):
+class NewColumnDialog(LazyDialog):
     """Dialog for creating a new Kanban column"""
 
     def __init__(self, log: logging.Logger, parent=None):
@@ -466,7 +610,6 @@ class NewColumnDialog(QDialog):
         super().__init__(parent)
         self.log = log
         self.column_name = ""
-        self._setup_ui()
         self.log.info("Initialized NewColumnDialog")
 
     def get_column_name(self) -> str:
@@ -496,6 +639,7 @@ class NewColumnDialog(QDialog):
         self.create_button = QPushButton("Create")
         self.create_button.clicked.connect(self._validate_and_accept)
         self.create_button.setEnabled(False)  # Disabled until valid input
+        self._create_enabled = False
 
         cancel_button = QPushButton("Cancel")
         cancel_button.clicked.connect(self.reject)
@@ -519,8 +663,11 @@ class NewColumnDialog(QDialog):
 
     def _check_input_validity(self):
         """Enable/disable create button based on input validity"""
-        name = self.name_edit.text().strip()
-        self.create_button.setEnabled(bool(name))
+        # Stop at the first non-whitespace character rather than stripping the name
+        enabled = any(not c.isspace() for c in self.name_edit.text())
+        if enabled != self._create_enabled:
+            self.create_button.setEnabled(enabled)
+            self._create_enabled = enabled
 
     def _validate_and_accept(self):
         """Validate input and accept dialog if valid"""
@@ -532,7 +679,7 @@ class NewColumnDialog(QDialog):
             return
 
         self.column_name = name
-        self.log.info(f"Column name validated: {name}")
+        self.log.info("Column name validated: %s", name)
         self.accept()
 
 
@@ -540,7 +687,7 @@ class NewColumnDialog(QDialog):
 # ==========================================================================================
 
 
-class DeleteColumnDialog(QDialog):
+class DeleteColumnDialog(LazyDialog):
     """
     Dialog that allows users to select a Kanban column to delete.
     """
@@ -557,8 +704,11 @@ class DeleteColumnDialog(QDialog):
         super().__init__(parent)
         self.setObjectName("deleteColumnDialog")
         self.log = log
+        self.columns = columns
         self.selected_column = None  # Store selected column
 
+    def _setup_ui(self):
+        """Initialize the dialog's user interface"""
         self.setWindowTitle("Delete Column")
         self.setModal(True)
 
@@ -568,8 +718,10 @@ class DeleteColumnDialog(QDialog):
         layout.addWidget(QLabel("Select a column to delete:"))
 
         # Dropdown menu for selecting a column
+        # Populate through a model so the combo box resets once, not once per row
         self.column_selector = QComboBox()
-        self.column_selector.addItems(columns)
+        self._column_model = QStringListModel(list(self.columns), self)
+        self.column_selector.setModel(self._column_model)
         layout.addWidget(self.column_selector)
 
         # Confirm and Cancel buttons
@@ -591,7 +743,7 @@ class DeleteColumnDialog(QDialog):
         Save the selected column and close the dialog.
         """
         self.selected_column = self.column_selector.currentText()
-        self.log.info(f"User selected column '{self.selected_column}' for deletion.")
+        self.log.info("User selected column '%s' for deletion.", self.selected_column)
         self.accept()
 
     def get_selected_column(self):
@@ -2,11 +2,12 @@ import logging
 import os
 import sys
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QObject, QRunnable, Qt, QThreadPool, pyqtSignal
 from PyQt6.QtWidgets import QApplication, QGridLayout, QMainWindow, QStatusBar, QWidget
 
 from pykanban.custom_logger import setup_logging
 from pykanban.database import KanbanDatabaseManager, QueryResult
+from pykanban.dialogs import path_exists
 from pykanban.menu_bar import MenuBar
 from pykanban.tabs import KanbanTabManager
 from pykanban.widgets import DayNightRadioButton
@@ -24,6 +25,69 @@ from pykanban.widgets import DayNightRadioButton
 # Insert Code here
 
 
+def _read_theme(path: str, cached: tuple[float, str] | None) -> tuple[float, str] | None:
+    """
+    Reads a .qss file unless the cached copy is still current.  This function only
+    touches the file system, so it is safe to call from a worker thread
+
+    :param path: The path to the .qss file
+    :param cached: The (mtime, style) last read from the file, or None
+    :return: The (mtime, style) of the file, or None if it does not exist
+    """
+    try:
+        mtime = os.stat(path).st_mtime
+        if cached is not None and cached[0] == mtime:
+            return cached
+
+        # QSS files are plain UTF-8, so skip text-mode newline translation
+        with open(path, "rb") as file:
+            return mtime, file.read().decode("utf-8")
+    except FileNotFoundError:
+        return None
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+class _ThemeLoaderSignals(QObject):
+    """
+    Signals emitted by a _ThemeLoader, which as a QRunnable cannot emit them itself
+    """
+
+    loaded = pyqtSignal(str, object)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+class _ThemeLoader(QRunnable):
+    """
+    Reads a .qss file on a thread pool and emits the result back to the GUI thread
+
+    :param path: The path to the .qss file
+    :param cached: The (mtime, style) last read from the file, or None
+    """
+
+    def __init__(self, path: str, cached: tuple[float, str] | None):
+        super().__init__()
+        self.path = path
+        self.cached = cached
+        self.signals = _ThemeLoaderSignals()
+
+    # ------------------------------------------------------------------------------------------
+
+    def run(self) -> None:
+        """
+        Reads the file and emits the (mtime, style) entry, or None if it is missing
+        """
+        self.signals.loaded.emit(self.path, _read_theme(self.path, self.cached))
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
 class KanbanViewManager(QMainWindow):
     """
     Class that integrates the application into a main window with tabs. This tab
@@ -42,6 +106,13 @@ class KanbanViewManager(QMainWindow):
         self.logger = log
         self.init_theme = False
         self.theme_status = None
+        # Stylesheet contents keyed by path, stored as (mtime, style)
+        self._qss_cache: dict[str, tuple[float, str]] = {}
+        # Stylesheet currently applied to the application
+        self._current_qss: str | None = None
+        # Most recently requested theme and the loader reading it in the background
+        self._requested_theme: str | None = None
+        self._theme_loader: _ThemeLoader | None = None
 
         # Set layout structure for application
         self.grid = QGridLayout()
@@ -74,18 +145,7 @@ class KanbanViewManager(QMainWindow):
         """
         Toggles the application to the day time style sheet
         """
-        if os.path.exists(self.day_theme):
-            with open(self.day_theme) as file:
-                style = file.read()
-                if self.init_theme:
-                    self.logger.info("Changing Kanban app to day theme")
-                QApplication.instance().setStyleSheet(style)
-                self.init_theme = True
-                self.themestatus = self.day_theme
-                self.repaint()
-                self.tabs.repaint()
-                for i in range(self.tabs.count()):
-                    self.tabs.widget(i).repaint()
+        self._set_theme(self.day_theme)
 
     # ------------------------------------------------------------------------------------------
 
@@ -93,22 +153,103 @@ class KanbanViewManager(QMainWindow):
         """
         Toggles the application to the night time style sheet
         """
-        if os.path.exists(self.night_theme):
-            with open(self.night_theme) as file:
-                style = file.read()
-                if self.init_theme:
-                    self.logger.info("Changing Kanban app to night theme")
-                QApplication.instance().setStyleSheet(style)
-                self.init_theme = True
-                self.theme_status = self.night_theme
-                self.repaint()
-                self.tabs.repaint()
-                for i in range(self.tabs.count()):
-                    self.tabs.widget(i).repaint()
+        self._set_theme(self.night_theme)
 
     # ==========================================================================================
     # PRIVATE-LIKE METHODS
 
+    def _set_theme(self, path: str) -> None:
+        """
+        Loads and applies a style sheet.  The initial theme is applied synchronously
+        so the window never appears unstyled, later toggles read the file on the
+        global thread pool and apply it once the read finishes
+
+        :param path: The path to the .qss file
+        """
+        self._requested_theme = path
+        if not self.init_theme:
+            self._apply_theme(path, self._load_theme(path))
+            return
+
+        loader = _ThemeLoader(path, self._qss_cache.get(path))
+        loader.signals.loaded.connect(self._on_theme_loaded)
+        # Hold a reference so the signal emitter outlives the queued delivery
+        self._theme_loader = loader
+        QThreadPool.globalInstance().start(loader)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _on_theme_loaded(self, path: str, entry: tuple[float, str] | None) -> None:
+        """
+        Receives a style sheet read on the thread pool and applies it if it is still
+        the most recently requested theme
+
+        :param path: The path to the .qss file
+        :param entry: The (mtime, style) read from the file, or None if it is missing
+        """
+        style = self._store_theme(path, entry)
+        if path == self._requested_theme:
+            self._apply_theme(path, style)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _apply_theme(self, path: str, style: str | None) -> None:
+        """
+        Applies a style sheet to the application
+
+        :param path: The path to the .qss file the style sheet was read from
+        :param style: The style sheet text, or None if the file does not exist
+        """
+        # Re-applying the active sheet would only make Qt restyle every widget
+        if style is None or style == self._current_qss:
+            return
+
+        if self.init_theme:
+            name = "day" if path == self.day_theme else "night"
+            self.logger.info("Changing Kanban app to %s theme", name)
+        # Every widget is repolished, so hold repaints until all of them are done
+        self.setUpdatesEnabled(False)
+        try:
+            QApplication.instance().setStyleSheet(style)
+        finally:
+            self.setUpdatesEnabled(True)
+        self._current_qss = style
+        self.init_theme = True
+        self.theme_status = path
+        # Qt restyles child widgets itself, so one coalesced update suffices
+        self.update()
+
+    # ------------------------------------------------------------------------------------------
+
+    def _load_theme(self, path: str) -> str | None:
+        """
+        Returns the contents of a .qss file, only reading it from disk when the
+        file has changed since it was last loaded
+
+        :param path: The path to the .qss file
+        :return: The style sheet text, or None if the file does not exist
+        """
+        return self._store_theme(path, _read_theme(path, self._qss_cache.get(path)))
+
+    # ------------------------------------------------------------------------------------------
+
+    def _store_theme(self, path: str, entry: tuple[float, str] | None) -> str | None:
+        """
+        Caches a style sheet read from disk
+
+        :param path: The path to the .qss file
+        :param entry: The (mtime, style) read from the file, or None if it is missing
+        :return: The style sheet text, or None if the file does not exist
+        """
+        if entry is None:
+            self.logger.warning("Theme sheet %s does not exist", path)
+            return None
+
+        self._qss_cache[path] = entry
+        return entry[1]
+
+    # ------------------------------------------------------------------------------------------
+
     def _create_initial_widgets(self) -> None:
         """This method instantiates all widgets for the todo_list application"""
         # Set control actuators that are persistent (not related to tabs)
@@ -190,6 +331,8 @@ class KanbanControllerManager(KanbanViewManager):
 
     def __init__(self, day_sheet: str, night_sheet: str, log: logging.Logger):
         self.kanban_db = None  # Initialize as None
+        # Database detached from the board whose connection is kept open for reuse
+        self._retained_db = None
         self.log = log
         super().__init__(day_sheet, night_sheet, log)
 
@@ -198,26 +341,16 @@ class KanbanControllerManager(KanbanViewManager):
 
     # ------------------------------------------------------------------------------------------
 
-    def create_database(self, db_path: str) -> QueryResult:
-        """Create and initialize a new Kanban database
+    def load_kanban_board(
+        self, snapshot: list[tuple[str, int, int, str, str]] | None = None
+    ):
+        """Load and display the Kanban board columns
 
         Args:
-            db_path: Path where the database should be created
-
-        Returns:
-            QueryResult indicating success/failure of database creation
+            snapshot: Optional list of (name, order, number, column_color, text_color)
+                      tuples already read with fetch_board_snapshot, in which case
+                      the database is not queried again
         """
-        self.kanban_db = KanbanDatabaseManager(db_path, self.log)
-        result = self.kanban_db.initialize_database()
-        if result.success:
-            self.tabs.db_manager = self.kanban_db
-            self.load_kanban_board()
-        return result
-
-    # ------------------------------------------------------------------------------------------
-
-    def load_kanban_board(self):
-        """Load and display the Kanban board columns"""
         if self.kanban_db:
             # Ensure tabs has the current db_manager reference
             self.tabs.db_manager = self.kanban_db  # Add this line
@@ -225,15 +358,126 @@ class KanbanControllerManager(KanbanViewManager):
             # First clear existing columns
             self.tabs.clear_columns()
 
-            # Then load columns from database
-            result = self.kanban_db.load_columns()
+            if snapshot is not None:
+                self.tabs.populate_columns(snapshot)
+                self.log.info("Successfully loaded Kanban board columns")
+                return
+
+            # Then read the board from the database in one query
+            result = self.kanban_db.fetch_board_snapshot()
             if result.success:
-                for name, number, column_color, text_color in result.data:
-                    self.tabs.add_column(name, number, column_color, text_color)
+                self.tabs.populate_columns(result.data)
                 self.log.info("Successfully reloaded Kanban board columns")
 
     # ------------------------------------------------------------------------------------------
 
+    def append_column_widget(self, name: str, order: int) -> None:
+        """Show a newly created, empty column without reloading the whole board
+
+        Args:
+            name: Name of the new column
+            order: Order value the column was stored with
+        """
+        self.tabs.insert_column(name, order)
+
+    # ------------------------------------------------------------------------------------------
+
+    def remove_column_widget(self, name: str) -> None:
+        """Take a deleted column off the board without reloading the whole board
+
+        Args:
+            name: Name of the deleted column
+        """
+        self.tabs.remove_column(name)
+
+    # ------------------------------------------------------------------------------------------
+
+    def attach_database(self, db_path: str) -> KanbanDatabaseManager:
+        """Make a database the active one, holding its connection open
+
+        A connection kept from a previously detached database, or the one still
+        attached, is reused when it points at the same file, otherwise it is closed.
+        A new connection is only opened when the database is first used, so
+        attaching a file the open worker has just read does no file I/O here.
+
+        Args:
+            db_path: Path to the database file
+
+        Returns:
+            The KanbanDatabaseManager now assigned to kanban_db
+        """
+        canonical_path = os.path.realpath(db_path)
+        current = self.kanban_db
+        if current is not None and current.canonical_path == canonical_path:
+            return current
+        if current is not None:
+            self.close_database()
+
+        retained, self._retained_db = self._retained_db, None
+        if retained is not None and retained.canonical_path == canonical_path:
+            self.kanban_db = retained
+            return retained
+        if retained is not None:
+            retained.close()
+
+        self.kanban_db = KanbanDatabaseManager(db_path, self.log)
+        self.kanban_db.open(defer=True)
+        return self.kanban_db
+
+    # ------------------------------------------------------------------------------------------
+
+    def is_active_database(self, canonical_path: str) -> bool:
+        """Check whether a file is the database currently shown on the board
+
+        Args:
+            canonical_path: Path to the database file as resolved by os.path.realpath
+
+        Returns:
+            True if canonical_path is the active database file
+        """
+        return (
+            self.kanban_db is not None and self.kanban_db.canonical_path == canonical_path
+        )
+
+    # ------------------------------------------------------------------------------------------
+
+    def detach_database(self) -> QueryResult:
+        """Detach the current database from the board without closing it
+
+        The connection is kept so that reopening the same file is immediate, it is
+        only closed when another file is attached, the file is deleted or the
+        application shuts down.
+
+        Returns:
+            QueryResult indicating success/failure of the operation
+        """
+        if not self.kanban_db:
+            return QueryResult(False, None, "No database is currently open")
+
+        self.release_database()
+        self._retained_db, self.kanban_db = self.kanban_db, None
+        self.tabs.db_manager = None
+
+        self.log.info("Database %s detached from the board", self._retained_db.db_path)
+        return QueryResult(True, None, "Database closed successfully")
+
+    # ------------------------------------------------------------------------------------------
+
+    def release_database(self, canonical_path: str | None = None) -> None:
+        """Close the connection kept for a detached database
+
+        Args:
+            canonical_path: Only release the connection if it belongs to this file,
+                            as resolved by os.path.realpath, defaults to releasing
+                            it regardless of file
+        """
+        retained = self._retained_db
+        if retained is not None and canonical_path in (None, retained.canonical_path):
+            retained.close()
+            self._retained_db = None
+
+    # ------------------------------------------------------------------------------------------
+
     def close_database(self) -> QueryResult:
         """Close the current database and clean up resources
 
@@ -246,28 +490,14 @@ class KanbanControllerManager(KanbanViewManager):
         try:
             db_path = self.kanban_db.db_path  # Store path for logging
 
-            # Ensure connection is open before trying to close
-            open_result = self.kanban_db.db_manager.open_db()
-            if not open_result.success:
-                self.log.error(
-                    f"Could not open database for closing: {open_result.message}"
-                )
-                return open_result
-
-            # Close the database connection
-            result = self.kanban_db.db_manager.close_db()
-            if not result.success:
-                self.log.error(f"Failed to close database: {result.message}")
-                return result
-
-            # Remove the database from Qt's connection pool
-            self.kanban_db.db_manager.remove_db()
+            # Close the connection and remove it from Qt's connection pool
+            self.kanban_db.close()
 
             # Clear the database references
             self.kanban_db = None
             self.tabs.db_manager = None
 
-            self.log.info(f"Database {db_path} successfully closed")
+            self.log.info("Database %s successfully closed", db_path)
             return QueryResult(True, None, "Database closed successfully")
 
         except Exception as e:
@@ -275,6 +505,14 @@ class KanbanControllerManager(KanbanViewManager):
             self.log.error(error_msg)
             return QueryResult(False, None, error_msg)
 
+    # ------------------------------------------------------------------------------------------
+
+    def shutdown(self) -> None:
+        """Close every database connection, called as the application quits"""
+        self.release_database()
+        if self.kanban_db:
+            self.close_database()
+
 
 # ==========================================================================================
 # ==========================================================================================
@@ -291,14 +529,15 @@ def main(day_sheet: str, night_sheet: str, log_path: str) -> None:
     logger.info("Initializing Kanban Session")
 
     # Verify files exist as part of debug error checking
-    if not os.path.exists(day_sheet):
-        logger.debug(f"Day Theme sheet {day_sheet} does not exist!")
-    if not os.path.exists(night_sheet):
-        logger.debug(f"Night Theme sheet {night_sheet} does not exist!")
+    if not path_exists(day_sheet):
+        logger.debug("Day Theme sheet %s does not exist!", day_sheet)
+    if not path_exists(night_sheet):
+        logger.debug("Night Theme sheet %s does not exist!", night_sheet)
 
     # begin Application
     app = QApplication(sys.argv)
     controller = KanbanControllerManager(day_sheet, night_sheet, logger)
+    app.aboutToQuit.connect(controller.shutdown)
     logger.info("Initializing Kanban to day theme")
     #    controller.set_day_theme()
     controller.show()
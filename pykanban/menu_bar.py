@@ -1,16 +1,28 @@
 import logging
 import os
+from functools import partial
+
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QRunnable, Qt, QThread, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QAction, QFont, QKeySequence, QShortcut
+from PyQt6.QtWidgets import (
+    QDialog,
+    QMenu,
+    QMenuBar,
+    QMessageBox,
+    QProgressDialog,
+    QStatusBar,
+    QWidget,
+)
 
-from PyQt6.QtGui import QAction, QFont
-from PyQt6.QtWidgets import QDialog, QMenu, QMenuBar, QMessageBox
-
-from pykanban.database import KanbanDatabaseManager
+from pykanban.database import FIXED_COLUMNS, KanbanDatabaseManager, QueryResult
 from pykanban.dialogs import (
     DeleteColumnDialog,
     DeleteDatabaseDialog,
     NewColumnDialog,
     NewDatabaseDialog,
     OpenDatabaseDialog,
+    clear_path_cache,
 )
 
 # ==========================================================================================
@@ -25,25 +37,370 @@ from pykanban.dialogs import (
 # ==========================================================================================
 # Insert Code here
 
+_MENU_FONT: QFont | None = None
+
+
+def _get_menu_font() -> QFont:
+    """
+    Returns the font shared by the menu bar and its menus.  The font is built on
+    first use because Qt requires a QApplication before creating fonts, and its
+    rendering strategy is fixed once here so the font engine lookup is reused.
+    """
+    global _MENU_FONT
+    if _MENU_FONT is None:
+        _MENU_FONT = QFont("Helvetica", 14)
+        _MENU_FONT.setStyleStrategy(QFont.StyleStrategy.PreferAntialias)
+        _MENU_FONT.setHintingPreference(QFont.HintingPreference.PreferFullHinting)
+    return _MENU_FONT
+
+
+# ------------------------------------------------------------------------------------------
+
+# Menu shortcuts, parsed into key sequences once at import rather than per action
+_SC_OPEN_DB = QKeySequence("Ctrl+Shift+O")
+_SC_NEW_DB = QKeySequence("Ctrl+Shift+N")
+_SC_CLOSE_DB = QKeySequence("Ctrl+Shift+C")
+_SC_DELETE_DB = QKeySequence("Ctrl+Shift+D")
+_SC_CREATE_COL = QKeySequence("Ctrl+Shift+X")
+_SC_DELETE_COL = QKeySequence("Ctrl+Shift+S")
+_SC_UNLOCK_COL = QKeySequence("Ctrl+Shift+U")
+_SC_LOCK_COL = QKeySequence("Ctrl+Shift+L")
+_SC_CREATE_PROJ = QKeySequence("Ctrl+Shift+P")
+_SC_DELETE_PROJ = QKeySequence("Ctrl+Shift+Q")
+_SC_MODIFY_PROJ = QKeySequence("Ctrl+Shift+M")
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def _status_bar_visible(widget: QWidget | None) -> bool:
+    """
+    Returns True if the window holding a widget shows a status bar, or if there is
+    no widget to check, so status tips are only skipped when nothing can show them
+
+    :param widget: A widget in the window to check
+    """
+    if widget is None:
+        return True
+    status_bar = widget.window().findChild(QStatusBar)
+    return status_bar is not None and status_bar.isVisible()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def _make_action(
+    text: str, slot, tip: str | None, shortcut: QKeySequence, parent: QMenu
+) -> QAction:
+    """
+    Builds a menu action connected to its slot.  No font is set on the action, a
+    menu draws actions without their own font in the menu's font.  The shortcut is
+    only shown in the action text, the key itself is handled by a QShortcut that
+    LazyMenu registers, so the two never compete for the same key.
+
+    :param text: The text displayed for the action
+    :param slot: Callable invoked when the action is triggered
+    :param tip: Status bar tip for the action, or None to leave it without one
+    :param shortcut: Pre-parsed keyboard shortcut for the action
+    :param parent: The menu that owns the action and deletes it along with itself
+    """
+    label = f"{text}\t{shortcut.toString(QKeySequence.SequenceFormat.NativeText)}"
+    action = QAction(label, parent)
+    action.triggered.connect(slot)
+    if tip is not None:
+        action.setStatusTip(tip)
+    return action
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+class LazyMenu:
+    """
+    Base for the menus of the menu bar, which defers creating a menu's actions
+    until the menu is first about to be shown.  Subclasses declare _MENU_SPEC, a
+    tuple of (key, text, slot name, tip, shortcut) entries, or None for a
+    separator, in display order.  The actions are owned by the menu, entries are
+    addressed by key, and keyboard shortcuts work before the actions exist through
+    register_shortcuts.
+
+    :param title: The title of the menu
+    :param tip: Status bar tip for the menu
+    :param font: A font object to set text attributes, defaults to the font shared
+                 by the menu bar
+    """
+
+    _MENU_SPEC: tuple = ()
+
+    def __init__(self, title: str, tip: str, font: QFont | None = None):
+        self.font = font if font is not None else _get_menu_font()
+        self.menu = QMenu(title)
+        self.menu.menuAction().setStatusTip(tip)
+        self.menu.setFont(self.font)
+
+        self._shortcuts = {}
+        self._actions = {}
+        self._window_widget = None
+        self.menu.aboutToShow.connect(self._build_actions)
+
+    # ------------------------------------------------------------------------------------------
+
+    def register_shortcuts(self, parent: QWidget):
+        """
+        Makes the menu's keyboard shortcuts live without building its actions
+
+        :param parent: Widget in the window the shortcuts should be active for
+        """
+        self._window_widget = parent
+        for entry in self._MENU_SPEC:
+            if entry is None:
+                continue
+            key, _, slot, _, shortcut = entry
+            sequence = QShortcut(shortcut, parent)
+            sequence.activated.connect(getattr(self, slot))
+            self._shortcuts[key] = sequence
+
+    # ------------------------------------------------------------------------------------------
+
+    def set_action_enabled(self, key: str, enabled: bool):
+        """
+        Enables or disables an entry of the menu along with its keyboard shortcut,
+        whether or not its action has been built yet
+
+        :param key: The key of the entry in _MENU_SPEC
+        :param enabled: True to enable the entry, False to disable it
+        """
+        if key in self._shortcuts:
+            self._shortcuts[key].setEnabled(enabled)
+        if key in self._actions:
+            self._actions[key].setEnabled(enabled)
+
+    # ------------------------------------------------------------------------------------------
+
+    def dispose(self):
+        """
+        Releases the menu, which deletes the actions it owns.  The menu is not a Qt
+        child of the menu bar, so without this a replaced menu bar would leave it
+        alive, and Qt slows down as the number of live actions grows.  A menu
+        Python already destroyed, as happens while the interpreter shuts down, is
+        skipped.
+        """
+        # The shortcuts are children of the menu bar and are deleted along with it
+        self._shortcuts.clear()
+        self._actions.clear()
+        if not sip.isdeleted(self.menu):
+            self.menu.deleteLater()
+
+    # ==========================================================================================
+    # PRIVATE LIKE METHODS
+
+    def _build_actions(self):
+        """
+        Creates the actions described by _MENU_SPEC and adds them to the menu, runs
+        once when the menu is first about to be shown.  The actions are installed
+        in one addActions call with updates and signals held off, so the menu
+        relayouts once rather than once per action.
+        """
+        self.menu.aboutToShow.disconnect(self._build_actions)
+        # Status tips are only wired up when the window has a status bar to show them
+        show_tips = _status_bar_visible(self._window_widget)
+        actions = []
+        for entry in self._MENU_SPEC:
+            if entry is None:
+                separator = QAction(self.menu)
+                separator.setSeparator(True)
+                actions.append(separator)
+                continue
+            key, text, slot, tip, shortcut = entry
+            action = _make_action(
+                text, getattr(self, slot), tip if show_tips else None, shortcut, self.menu
+            )
+            if key in self._shortcuts:
+                action.setEnabled(self._shortcuts[key].isEnabled())
+            self._actions[key] = action
+            actions.append(action)
+
+        self.menu.setUpdatesEnabled(False)
+        self.menu.blockSignals(True)
+        try:
+            self.menu.addActions(actions)
+        finally:
+            self.menu.blockSignals(False)
+            self.menu.setUpdatesEnabled(True)
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+class DbOpenWorker(QObject):
+    """
+    Worker that opens an existing database on a background QThread and reads the
+    columns needed to draw the Kanban board.  Qt database connections may only be
+    used by the thread that created them, so the worker uses its own temporary
+    connection and hands back plain data rather than the connection itself.
+
+    :param db_path: Path to the database file
+    :param log: Logger instance for tracking operations
+    """
+
+    progress_text = "Opening database..."
+    success_text = "Database opened successfully."
+    failure_text = "Error opening database"
+
+    opened = pyqtSignal(str, list)
+    failed = pyqtSignal(str)
+    finished = pyqtSignal()
+
+    def __init__(self, db_path: str, log: logging.Logger):
+        super().__init__()
+        self.db_path = db_path
+        self.log = log
+
+    # ------------------------------------------------------------------------------------------
+
+    def run(self):
+        """
+        Reads the board columns and emits opened with them, or failed with an error
+        message
+        """
+        try:
+            kanban_db = KanbanDatabaseManager(self.db_path, self.log)
+            try:
+                result = self._read_board(kanban_db)
+            finally:
+                kanban_db.close()
+
+            if result.success:
+                self.opened.emit(self.db_path, result.data)
+            else:
+                self.failed.emit(f"{self.failure_text}: {result.message}")
+        except Exception as e:
+            self.failed.emit(f"{self.failure_text}: {str(e)}")
+        finally:
+            self.finished.emit()
+
+    # ------------------------------------------------------------------------------------------
+
+    def _read_board(self, kanban_db: KanbanDatabaseManager) -> QueryResult:
+        """
+        Reads the board columns over the worker's connection
+
+        :param kanban_db: Manager for the worker's own connection
+        :return: QueryResult holding the fetch_board_snapshot rows
+        """
+        return kanban_db.fetch_board_snapshot()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+class DbCreateWorker(DbOpenWorker):
+    """
+    Worker that creates and initializes a new database on a background QThread.
+    It reports back exactly like DbOpenWorker, handing over the default columns
+    that initialize_database wrote so the board is drawn without reading them back.
+
+    :param db_path: Path where the database should be created
+    :param log: Logger instance for tracking operations
+    """
+
+    progress_text = "Creating database..."
+    success_text = "Database created successfully."
+    failure_text = "Failed to create database"
+
+    # ------------------------------------------------------------------------------------------
+
+    def _read_board(self, kanban_db: KanbanDatabaseManager) -> QueryResult:
+        """
+        Creates the schema and default columns over the worker's connection
+
+        :param kanban_db: Manager for the worker's own connection
+        :return: QueryResult holding the default columns in fetch_board_snapshot form
+        """
+        return kanban_db.initialize_database()
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+class _DbDeleteSignals(QObject):
+    """
+    Signals emitted by a _DbDeleter, which as a QRunnable cannot emit them itself
+    """
+
+    done = pyqtSignal(str, bool, str)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+class _DbDeleter(QRunnable):
+    """
+    Removes a database file, and any WAL and shared-memory files SQLite left next
+    to it, on the global thread pool so a slow file system does not stall the GUI
+
+    :param db_path: Path to the database file
+    """
+
+    def __init__(self, db_path: str):
+        super().__init__()
+        self.db_path = db_path
+        self.signals = _DbDeleteSignals()
+
+    # ------------------------------------------------------------------------------------------
+
+    def run(self):
+        """
+        Deletes the files and emits done with the path, whether it succeeded and an
+        error message
+        """
+        try:
+            os.remove(self.db_path)
+            for suffix in ("-wal", "-shm"):
+                try:
+                    os.remove(self.db_path + suffix)
+                except FileNotFoundError:
+                    pass
+        except OSError as e:
+            self.signals.done.emit(self.db_path, False, f"Failed to delete database: {e}")
+            return
+        self.signals.done.emit(self.db_path, True, "")
+
+
+# ==========================================================================================
+# ==========================================================================================
 
-class FileMenu:
+
+class FileMenu(LazyMenu):
     """
     Class that builds all functionality necessary to impliment the File attributes
     of the menu bar
 
-    :param font: A font object to set text attributes
+    :param controller: The application's controller instance
+    :param log: Logger instance for tracking operations
+    :param font: A font object to set text attributes, defaults to the shared font
     """
 
-    def __init__(self, controller, font: QFont, log: logging.Logger):
+    _MENU_SPEC = (
+        ("open_action", "Open", "open_db", "Open an existing database", _SC_OPEN_DB),
+        ("new_action", "New", "new_db", "Create a new database", _SC_NEW_DB),
+        ("close_action", "Close", "close_db", "Close current database", _SC_CLOSE_DB),
+        None,
+        ("delete_action", "Delete", "delete_db", "Delete a database", _SC_DELETE_DB),
+    )
+
+    def __init__(self, controller, log: logging.Logger, font: QFont | None = None):
+        super().__init__("File", "File and I/O Options", font)
         self.controller = controller
         self.log = log
-        self.font = font
-        self.menu = QMenu("File")
-        self.menu.menuAction().setStatusTip("File and I/O Options")
-
-        self.menu.setFont(self.font)
-        self._create_actions()
-        self._add_actions()
+        # Built on first use and reused for every later open while a board is shown
+        self._reopen_confirm = None
+        # Background open and delete in flight, None while idle
+        self._open_progress = self._open_worker = self._open_thread = None
+        self._delete_progress = self._db_deleter = None
 
     # ------------------------------------------------------------------------------------------
 
@@ -51,15 +408,7 @@ class FileMenu:
         """Method that handles opening an existing database"""
         # Check if a database is already open
         if self.controller.kanban_db:
-            reply = QMessageBox.question(
-                self.menu,
-                "Database Already Open",
-                "A database is open. Would you like to close it and open a new one?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No,
-            )
-
-            if reply == QMessageBox.StandardButton.No:
+            if not self._confirm_reopen():
                 return
 
             # Close the current database
@@ -68,24 +417,7 @@ class FileMenu:
         # Show the open database dialog
         dialog = OpenDatabaseDialog(self.log, self.menu)
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            db_path = dialog.get_database_path()
-            try:
-                # Create new database manager
-                self.controller.kanban_db = KanbanDatabaseManager(db_path, self.log)
-
-                # Load the Kanban board
-                self.controller.load_kanban_board()
-
-                self.log.info(f"Successfully opened database: {db_path}")
-                QMessageBox.information(
-                    self.menu, "Success", "Database opened successfully."
-                )
-
-            except Exception as e:
-                error_msg = f"Error opening database: {str(e)}"
-                self.log.error(error_msg)
-                QMessageBox.critical(self.menu, "Error", error_msg)
-                self.controller.kanban_db = None
+            self._start_open_worker(DbOpenWorker(dialog.get_database_path(), self.log))
         else:
             self.log.info("User cancelled database opening")
 
@@ -95,24 +427,21 @@ class FileMenu:
         """
         Method that encodes the functionality of the New attribute
         """
+        # Check if a database is already open
+        if self.controller.kanban_db:
+            if not self._confirm_reopen():
+                return
+
+            # Close the current database
+            self.close_db()
+
         dialog = NewDatabaseDialog(self.log, self.menu)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             db_path = dialog.get_database_path()
-            self.log.info(f"User confirmed database creation at: {db_path}")
+            self.log.info("User confirmed database creation at: %s", db_path)
 
-            result = self.controller.create_database(db_path)
-            if result.success:
-                self.log.info(
-                    f"Successfully created and initialized database at: {db_path}"
-                )
-                QMessageBox.information(
-                    self.menu, "Success", "Database created successfully."
-                )
-            else:
-                self.log.error(f"Failed to initialize database: {result.message}")
-                QMessageBox.critical(
-                    self.menu, "Error", f"Failed to create database: {result.message}"
-                )
+            # The file is written on a worker thread, the board follows once it is done
+            self._start_open_worker(DbCreateWorker(db_path, self.log))
         else:
             self.log.info("User cancelled database creation")
 
@@ -126,17 +455,16 @@ class FileMenu:
             self.log.info("No database is currently open")
             return
 
-        # Call the controller's close_database method
-        result = self.controller.close_database()
+        # Clear the board first
+        self._clear_kanban_board()
+
+        # Detach the database from the board, its connection is kept for reuse
+        result = self.controller.detach_database()
 
         if result.success:
-            # Clear all columns from the Kanban board
-            self._clear_kanban_board()
             self.log.info("Database closed and Kanban board cleared successfully")
         else:
-            self.log.error(f"Failed to close database: {result.message}")
-            # Try to clear the board anyway
-            self._clear_kanban_board()
+            self.log.error("Failed to close database: %s", result.message)
 
     # ------------------------------------------------------------------------------------------
 
@@ -145,6 +473,11 @@ class FileMenu:
         Method that handles database deletion with confirmation. Only allows deletion
         of .db files and prevents deletion of currently active database.
         """
+        # Only one delete runs at a time, the next waits for the pool to report back
+        if self._db_deleter is not None:
+            self.log.info("A database deletion is already in progress")
+            return
+
         dialog = DeleteDatabaseDialog(self.log, self.menu)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             db_path = dialog.get_database_path()
@@ -159,81 +492,174 @@ class FileMenu:
                 QMessageBox.critical(self.menu, "Error", error_msg)
                 return
 
+            # Resolve the path once, symlinks included, for both checks below
+            canonical_path = os.path.realpath(db_path)
+
             # Check if this is the currently active database
-            current_db_path = (
-                self.controller.kanban_db.db_path if self.controller.kanban_db else None
-            )
-            if current_db_path and os.path.abspath(db_path) == os.path.abspath(
-                current_db_path
-            ):
+            if self.controller.is_active_database(canonical_path):
                 error_msg = "Cannot delete the currently active database"
                 self.log.error(error_msg)
                 QMessageBox.critical(self.menu, "Error", error_msg)
                 return
 
-            try:
-                os.remove(db_path)
-                self.log.info(f"Successfully deleted database: {db_path}")
-                QMessageBox.information(
-                    self.menu, "Success", "Database deleted successfully."
-                )
-            except OSError as e:
-                error_msg = f"Failed to delete database: {e}"
-                self.log.error(error_msg)
-                QMessageBox.critical(self.menu, "Error", error_msg)
-            except Exception as e:
-                error_msg = f"Unexpected error while deleting database: {str(e)}"
-                self.log.error(error_msg)
-                QMessageBox.critical(self.menu, "Error", error_msg)
+            # A connection kept open for a detached database would hold the file
+            self.controller.release_database(canonical_path)
+            self._start_delete(db_path)
         else:
             self.log.info("User cancelled database deletion")
 
     # ==========================================================================================
     # PRIVATE LIKE METHODS
 
-    def _create_actions(self):
-        """
-        Creates and connects slots for attributes of the File menu bar item
-        """
-        # Set up Open menu bar option
-        self.open_action = QAction("Open")
-        self.open_action.setFont(self.font)
-        self.open_action.triggered.connect(self.open_db)
-        self.open_action.setStatusTip("Open an existing database")
-        self.open_action.setShortcut("Ctrl+Shift+O")
-
-        # Set up New menu bar option
-        self.new_action = QAction("New")
-        self.new_action.setFont(self.font)
-        self.new_action.triggered.connect(self.new_db)
-        self.new_action.setStatusTip("Create a new database")
-        self.new_action.setShortcut("Ctrl+Shift+N")
-
-        # Set up Close menu bar option
-        self.close_action = QAction("Close")
-        self.close_action.setFont(self.font)
-        self.close_action.triggered.connect(self.close_db)
-        self.close_action.setStatusTip("Close current database")
-        self.close_action.setShortcut("Ctrl+Shift+C")
-
-        # Set up Delete menu bar option
-        self.delete_action = QAction("Delete")
-        self.delete_action.setFont(self.font)
-        self.delete_action.triggered.connect(self.delete_db)
-        self.delete_action.setStatusTip("Delete a database")
-        self.delete_action.setShortcut("Ctrl+Shift+D")
+    def _confirm_reopen(self) -> bool:
+        """
+        Asks whether the open database should be closed so another can be opened.
+        The message box is created once and reused on later calls.
+
+        :return: True if the user chose to open another database
+        """
+        if self._reopen_confirm is None:
+            confirm = QMessageBox(self.menu)
+            confirm.setIcon(QMessageBox.Icon.Question)
+            confirm.setWindowTitle("Database Already Open")
+            confirm.setText(
+                "A database is open. Would you like to close it and open a new one?"
+            )
+            confirm.setStandardButtons(
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+            confirm.setDefaultButton(QMessageBox.StandardButton.No)
+            self._reopen_confirm = confirm
+        return self._reopen_confirm.exec() == QMessageBox.StandardButton.Yes
+
+    # ------------------------------------------------------------------------------------------
+
+    def _start_open_worker(self, worker: DbOpenWorker):
+        """
+        Runs a worker that opens or creates a database on a background thread while
+        a busy indicator is shown, so the window stays responsive while SQLite reads
+        or writes the file
+
+        :param worker: A DbOpenWorker or DbCreateWorker that has not been started
+        """
+        self.set_action_enabled("open_action", False)
+        self.set_action_enabled("new_action", False)
+        self._open_progress = QProgressDialog(worker.progress_text, None, 0, 0, self.menu)
+        self._open_progress.setWindowTitle("Database")
+        self._open_progress.setWindowModality(Qt.WindowModality.WindowModal)
+
+        self._open_thread = QThread()
+        self._open_worker = worker
+        self._open_worker.moveToThread(self._open_thread)
+
+        self._open_thread.started.connect(self._open_worker.run)
+        self._open_worker.opened.connect(self._on_db_opened)
+        self._open_worker.failed.connect(self._on_db_open_failed)
+        self._open_worker.finished.connect(self._open_thread.quit)
+        self._open_thread.finished.connect(self._on_open_worker_finished)
+
+        self._open_thread.start()
+
+    # ------------------------------------------------------------------------------------------
+
+    def _on_db_opened(self, db_path: str, snapshot: list):
+        """
+        Attaches the opened or created database to the controller and draws the
+        board from the snapshot handed back by the worker
+
+        :param db_path: Path to the database file
+        :param snapshot: List of (name, order, number, column_color, text_color)
+                         tuples
+        """
+        self._open_progress.close()
+        worker = self._open_worker
+        try:
+            # The worker's connection belonged to its thread, attach one for this one,
+            # opened on first use so the board is drawn without touching the file
+            self.controller.attach_database(db_path)
+            self.controller.load_kanban_board(snapshot)
+
+            self.log.info("%s: %s", worker.success_text, db_path)
+            QMessageBox.information(self.menu, "Success", worker.success_text)
+
+        except Exception as e:
+            if self.controller.kanban_db:
+                self.controller.close_database()
+            self._on_db_open_failed(f"{worker.failure_text}: {str(e)}")
+
+    # ------------------------------------------------------------------------------------------
+
+    def _on_db_open_failed(self, error_msg: str):
+        """
+        Reports a database that could not be opened
+
+        :param error_msg: Description of the failure
+        """
+        self._open_progress.close()
+        self.log.error(error_msg)
+        QMessageBox.critical(self.menu, "Error", error_msg)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _on_open_worker_finished(self):
+        """
+        Releases the worker thread once the open or create has completed
+        """
+        self._open_progress.deleteLater()
+        self._open_worker.deleteLater()
+        self._open_thread.deleteLater()
+        self._open_progress = self._open_worker = self._open_thread = None
+        self.set_action_enabled("open_action", True)
+        self.set_action_enabled("new_action", True)
+        # A created database is a new file the dialogs may have cached as missing
+        clear_path_cache()
+
+    # ------------------------------------------------------------------------------------------
+
+    def _start_delete(self, db_path: str):
+        """
+        Deletes a database file on the global thread pool while a busy indicator is
+        shown
+
+        :param db_path: Path to the database file
+        """
+        self.set_action_enabled("delete_action", False)
+        self._delete_progress = QProgressDialog(
+            "Deleting database...", None, 0, 0, self.menu
+        )
+        self._delete_progress.setMinimumDuration(0)
+        self._delete_progress.show()
+
+        deleter = _DbDeleter(db_path)
+        deleter.signals.done.connect(self._on_db_deleted)
+        # Hold a reference so the signal emitter outlives the queued delivery
+        self._db_deleter = deleter
+        QThreadPool.globalInstance().start(deleter)
 
     # ------------------------------------------------------------------------------------------
 
-    def _add_actions(self):
+    def _on_db_deleted(self, db_path: str, success: bool, error_msg: str):
         """
-        Adds slots for the File menu bar item
+        Reports the outcome of a background delete to the user
+
+        :param db_path: Path to the database file
+        :param success: True if the database file was removed
+        :param error_msg: Description of the failure, empty on success
         """
-        self.menu.addAction(self.open_action)
-        self.menu.addAction(self.new_action)
-        self.menu.addAction(self.close_action)
-        self.menu.addSeparator()  # Add visual separatio
-        self.menu.addAction(self.delete_action)
+        self._delete_progress.close()
+        self._delete_progress.deleteLater()
+        self._delete_progress = self._db_deleter = None
+        self.set_action_enabled("delete_action", True)
+        clear_path_cache()
+
+        if success:
+            self.log.info("Successfully deleted database: %s", db_path)
+            QMessageBox.information(
+                self.menu, "Success", "Database deleted successfully."
+            )
+        else:
+            self.log.error(error_msg)
+            QMessageBox.critical(self.menu, "Error", error_msg)
 
     # ------------------------------------------------------------------------------------------
 
@@ -242,60 +668,66 @@ class FileMenu:
         Helper method to clear all columns from the Kanban board
         """
         try:
-            # Get the column layout from the tabs
-            column_layout = self.controller.tabs.column_layout
-
-            # Remove all widgets from the layout
-            while column_layout.count():
-                # Get the widget at index 0
-                item = column_layout.takeAt(0)
-                if item is not None and item.widget():
-                    # Hide and delete the widget
-                    widget = item.widget()
-                    widget.hide()
-                    widget.deleteLater()
-
-            # Force a layout update
-            self.controller.tabs.column_layout.update()
-
+            self.controller.tabs.clear_columns()
             self.log.info("Successfully cleared Kanban board")
 
         except Exception as e:
-            self.log.error(f"Error clearing Kanban board: {str(e)}")
+            self.log.error("Error clearing Kanban board: %s", e)
 
 
 # ==========================================================================================
 # ==========================================================================================
 
 
-class ColumnMenu:
+class ColumnMenu(LazyMenu):
     """
     Class that builds all functionality necessary to implement the Column attributes
     of the menu bar
 
     Args:
         controller: The application's controller instance
-        font: A font object to set text attributes
         log: Logger instance for tracking operations
+        font: A font object to set text attributes, defaults to the shared font
     """
 
-    def __init__(self, controller, font: QFont, log: logging.Logger):
+    _MENU_SPEC = (
+        (
+            "create_action",
+            "Create Column",
+            "create_col",
+            "Create a new Kanban column",
+            _SC_CREATE_COL,
+        ),
+        (
+            "delete_action",
+            "Delete Column",
+            "delete_col",
+            "Delete a Kanban column",
+            _SC_DELETE_COL,
+        ),
+        None,
+        (
+            "unlock_action",
+            "Unlock",
+            "unlock_col",
+            "Unlock Kanban columns",
+            _SC_UNLOCK_COL,
+        ),
+        ("lock_action", "Lock", "lock_col", "Lock Kanban columns", _SC_LOCK_COL),
+    )
+
+    def __init__(self, controller, log: logging.Logger, font: QFont | None = None):
+        super().__init__("Columns", "Kanban Column Options", font)
         self.controller = controller
-        self.font = font
         self.log = log
-        self.menu = QMenu("Columns")
-        self.menu.menuAction().setStatusTip("Kanban Column Options")
-
-        self.menu.setFont(self.font)
-        self._create_actions()
-        self._add_actions()
 
     # ------------------------------------------------------------------------------------------
 
     def create_col(self):
         """Method that creates a new Kanban column"""
         # Check if a database is open
-        if not self.controller.kanban_db:
+        kanban_db = self.controller.kanban_db
+        if not kanban_db:
             QMessageBox.warning(
                 self.menu,
                 "No Database Open",
@@ -308,21 +740,11 @@ class ColumnMenu:
             column_name = dialog.get_column_name()
 
             try:
-                # Get the order value (before Complete)
-                result = self.controller.kanban_db.get_order_for_new_column()
-                if not result.success:
-                    raise Exception(f"Failed to get column order: {result.message}")
-
-                new_order = result.data
-
-                # Add the column
-                result = self.controller.kanban_db.add_column(
-                    name=column_name, order=new_order
-                )
+                # Place the column before Complete and insert it in one transaction
+                result = kanban_db.create_column_atomic(column_name)
 
                 if result.success:
-                    # Refresh the Kanban board
-                    self.controller.load_kanban_board()
+                    self.controller.append_column_widget(column_name, result.data)
                     QMessageBox.information(
                         self.menu,
                         "Success",
@@ -334,7 +756,7 @@ class ColumnMenu:
                     )
 
             except Exception as e:
-                self.log.error(f"Error creating column: {str(e)}")
+                self.log.error("Error creating column: %s", e)
                 QMessageBox.critical(
                     self.menu, "Error", f"Failed to create column: {str(e)}"
                 )
@@ -344,7 +766,8 @@ class ColumnMenu:
     def delete_col(self):
         """Allow the user to delete a Kanban column by selecting from a list"""
         # Check if a database is open
-        if not self.controller.kanban_db:
+        kanban_db = self.controller.kanban_db
+        if not kanban_db:
             QMessageBox.warning(
                 self.menu,
                 "No Database Open",
@@ -353,7 +776,7 @@ class ColumnMenu:
             return
 
         # Fetch all columns except "Ready to Start" and "Complete"
-        result = self.controller.kanban_db.load_columns()
+        result = kanban_db.load_columns()
         if not result.success:
             QMessageBox.critical(
                 self.menu, "Error", f"Failed to retrieve columns: {result.message}"
@@ -363,7 +786,7 @@ class ColumnMenu:
         deletable_columns = [
             name
             for name, number, column_color, text_color in result.data
-            if name not in ["Ready to Start", "Complete"]
+            if name not in FIXED_COLUMNS
         ]
 
         if not deletable_columns:
@@ -377,10 +800,10 @@ class ColumnMenu:
         if dialog.exec() == QDialog.DialogCode.Accepted:
             selected_column = dialog.get_selected_column()
             if selected_column:
-                result = self.controller.kanban_db.soft_delete_column(selected_column)
+                result = kanban_db.soft_delete_column(selected_column)
                 if result.success:
-                    # Refresh the Kanban board
-                    self.controller.load_kanban_board()
+                    # Only the deleted column changes on the board
+                    self.controller.remove_column_widget(selected_column)
                     QMessageBox.information(
                         self.menu,
                         "Success",
@@ -397,7 +820,7 @@ class ColumnMenu:
         """
         Method that encodes the functionality of the Unlock attribute
         """
-        print("Unlocked Kanban Columns")
+        self.log.debug("Unlocked Kanban Columns")
 
     # ------------------------------------------------------------------------------------------
 
@@ -405,76 +828,50 @@ class ColumnMenu:
         """
         Method that encodes the functionality of the Unlock attribute
         """
-        print("Locked Kanban Columns")
-
-    # ==========================================================================================
-    # PRIVATE LIKE METHODS
-
-    def _create_actions(self):
-        """
-        Creates and connects slots for attributes of the File menu bar item
-        """
-        # Set up Open menu bar option
-        self.create_action = QAction("Create Column")
-        self.create_action.setFont(self.font)
-        self.create_action.triggered.connect(self.create_col)
-        self.create_action.setStatusTip("Create a new Kanban column")
-        self.create_action.setShortcut("Ctrl+Shift+X")
-
-        # Set up Delete menu bar option
-        self.delete_action = QAction("Delete Column")
-        self.delete_action.setFont(self.font)
-        self.delete_action.triggered.connect(self.delete_col)
-        self.delete_action.setStatusTip("Delete a Kanban column")
-        self.delete_action.setShortcut("Ctrl+Shift+S")
-
-        # Set up Delete menu bar option
-        self.unlock_action = QAction("Unlock")
-        self.unlock_action.setFont(self.font)
-        self.unlock_action.triggered.connect(self.unlock_col)
-        self.unlock_action.setStatusTip("Unlock Kanban columns")
-        self.unlock_action.setShortcut("Ctrl+Shift+U")
-
-        # Set up Delete menu bar option
-        self.lock_action = QAction("Lock")
-        self.lock_action.setFont(self.font)
-        self.lock_action.triggered.connect(self.lock_col)
-        self.lock_action.setStatusTip("Lock Kanban columns")
-        self.lock_action.setShortcut("Ctrl+Shift+L")
-
-    # ------------------------------------------------------------------------------------------
-
-    def _add_actions(self):
-        """
-        Adds slots for the File menu bar item
-        """
-        self.menu.addAction(self.create_action)
-        self.menu.addAction(self.delete_action)
-        self.menu.addSeparator()  # Add visual separatio
-        self.menu.addAction(self.unlock_action)
-        self.menu.addAction(self.lock_action)
+        self.log.debug("Locked Kanban Columns")
 
 
 # ==========================================================================================
 # ==========================================================================================
 
 
-class ProjectMenu:
+class ProjectMenu(LazyMenu):
     """
     Class that builds all functionality necessary to impliment the Project attributes
     of the menu bar
 
-    :param font: A font object to set text attributes
+    :param log: Logger instance for tracking operations
+    :param font: A font object to set text attributes, defaults to the shared font
     """
 
-    def __init__(self, font: QFont):
-        self.font = font
-        self.menu = QMenu("Project")
-        self.menu.menuAction().setStatusTip("Options to create and modify projects")
-
-        self.menu.setFont(self.font)
-        self._create_actions()
-        self._add_actions()
+    _MENU_SPEC = (
+        (
+            "create_action",
+            "Create Project",
+            "create_project",
+            "Create a new Kanban project",
+            _SC_CREATE_PROJ,
+        ),
+        (
+            "modify_action",
+            "Unlock",
+            "modify_project",
+            "Modify a Kanban project",
+            _SC_MODIFY_PROJ,
+        ),
+        None,
+        (
+            "delete_action",
+            "Delete Project",
+            "delete_project",
+            "Delete a Kanban project",
+            _SC_DELETE_PROJ,
+        ),
+    )
+
+    def __init__(self, log: logging.Logger, font: QFont | None = None):
+        super().__init__("Project", "Options to create and modify projects", font)
+        self.log = log
 
     # ------------------------------------------------------------------------------------------
 
@@ -482,7 +879,7 @@ class ProjectMenu:
         """
         Method that encodes the functionality of the Create Project attribute
         """
-        print("Created a new Kanban Project")
+        self.log.debug("Created a new Kanban Project")
 
     # ------------------------------------------------------------------------------------------
 
@@ -490,7 +887,7 @@ class ProjectMenu:
         """
         Method that encodes the functionality of the Delete Project attribute
         """
-        print("Deleted a Kanban Project")
+        self.log.debug("Deleted a Kanban Project")
 
     # ------------------------------------------------------------------------------------------
 
@@ -498,71 +895,56 @@ class ProjectMenu:
         """
         Method that encodes the functionality of the modify project attribute
         """
-        print("Modify a Kanban Project")
+        self.log.debug("Modify a Kanban Project")
 
-    # ==========================================================================================
-    # PRIVATE LIKE METHODS
-
-    def _create_actions(self):
-        """
-        Creates and connects slots for attributes of the File menu bar item
-        """
-        # Set up Open menu bar option
-        self.create_action = QAction("Create Project")
-        self.create_action.setFont(self.font)
-        self.create_action.triggered.connect(self.create_project)
-        self.create_action.setStatusTip("Create a new Kanban project")
-        self.create_action.setShortcut("Ctrl+Shift+P")
 
-        # Set up Delete menu bar option
-        self.delete_action = QAction("Delete Project")
-        self.delete_action.setFont(self.font)
-        self.delete_action.triggered.connect(self.delete_project)
-        self.delete_action.setStatusTip("Delete a Kanban project")
-        self.delete_action.setShortcut("Ctrl+Shift+Q")
+# ==========================================================================================
+# ==========================================================================================
 
-        # Set up Delete menu bar option
-        self.modify_action = QAction("Unlock")
-        self.modify_action.setFont(self.font)
-        self.modify_action.triggered.connect(self.modify_project)
-        self.modify_action.setStatusTip("Modify a Kanban project")
-        self.modify_action.setShortcut("Ctrl+Shift+M")
 
-    # ------------------------------------------------------------------------------------------
+def _dispose_menus(menus: tuple[LazyMenu, ...]):
+    """
+    Disposes of the menus of a menu bar that has been destroyed
 
-    def _add_actions(self):
-        """
-        Adds slots for the File menu bar item
-        """
-        self.menu.addAction(self.create_action)
-        self.menu.addAction(self.modify_action)
-        self.menu.addSeparator()  # Add visual separatio
-        self.menu.addAction(self.delete_action)
+    :param menus: The menus that were shown in the menu bar
+    """
+    for menu in menus:
+        menu.dispose()
 
 
-# ==========================================================================================
-# ==========================================================================================
+# ------------------------------------------------------------------------------------------
 
 
 class MenuBar(QMenuBar):
     """
     Custom implementation of the QMenuBar item.  This class integrates all menu
-    bar classes into one implementation
+    bar classes into one implementation.  Only the menus' titles and keyboard
+    shortcuts are set up here; each menu creates its actions the first time it is
+    opened, see LazyMenu.
 
     :param controller: A ToDoListController object
+    :param log: Logger instance for tracking operations
     """
 
     def __init__(self, controller, log: logging.Logger):
         super().__init__()
-        font = QFont("Helvetica", 14)
-        self.setFont(font)  # Set font for top-level menu
-        self.file_menu = FileMenu(controller, font, log)
-        self.col_menu = ColumnMenu(controller, font, log)
-        self.proj_menu = ProjectMenu(font)
-
-        self.addMenu(self.file_menu.menu)
-        self.addMenu(self.col_menu.menu)
-        self.addMenu(self.proj_menu.menu)
+        self.setFont(_get_menu_font())  # Set font for top-level menu
+        self.file_menu = FileMenu(controller, log)
+        self.col_menu = ColumnMenu(controller, log)
+        self.proj_menu = ProjectMenu(log)
+
+        submenus = (self.file_menu, self.col_menu, self.proj_menu)
+        self.setUpdatesEnabled(False)
+        try:
+            for submenu in submenus:
+                submenu.register_shortcuts(self)
+                self.addMenu(submenu.menu)
+        finally:
+            self.setUpdatesEnabled(True)
+
+        # Connected to a partial rather than a method, as self is gone by the time
+        # destroyed is emitted
+        self.destroyed.connect(partial(_dispose_menus, submenus))
 
 
 # ==========================================================================================
@@ -1,6 +1,8 @@
 import logging
+from bisect import bisect_left
+from contextlib import contextmanager
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import (
     QDialog,
     QHBoxLayout,
@@ -25,19 +27,53 @@ from pykanban.widgets import KanbanColumn
 # ==========================================================================================
 # Insert Code here
 
+# Qt enum members used while building and rebuilding the board, looked up once
+_AS_NEEDED = Qt.ScrollBarPolicy.ScrollBarAsNeeded
+_ALWAYS_OFF = Qt.ScrollBarPolicy.ScrollBarAlwaysOff
+_ALIGN_LEFT = Qt.AlignmentFlag.AlignLeft
+
+# ------------------------------------------------------------------------------------------
+
+
+@contextmanager
+def _batched_updates(container: QWidget, layout: QHBoxLayout):
+    """Suspend a container's layout and repaints while its columns change in bulk
+
+    The layout is laid out once on exit instead of once per added or removed
+    column.
+
+    Args:
+        container: Widget whose repaints are suspended
+        layout: Layout of the container that is disabled meanwhile
+    """
+    container.setUpdatesEnabled(False)
+    layout.setEnabled(False)
+    try:
+        yield
+    finally:
+        layout.setEnabled(True)
+        container.setUpdatesEnabled(True)
+    layout.activate()
+
+
+# ------------------------------------------------------------------------------------------
+
 
 class KanbanTabManager(QTabWidget):
 
     class KanbanColumnContainer(QWidget):
         """Container widget for Kanban columns that supports drag and drop"""
 
+        # Columns that always stay first and last and can never be dragged
+        FIXED_COLUMNS = KanbanColumn.FIXED_COLUMNS
+
         def __init__(self, parent=None, log=None, db_manager=None):
             """Initialize the column container
 
             Args:
                 parent: Parent widget
                 log: Logger instance
-                db_manager: Database manager for fetching column order
+                db_manager: Database manager the columns are stored in
             """
             super().__init__(parent)
             self.log = log
@@ -47,11 +83,39 @@ class KanbanTabManager(QTabWidget):
             # Dictionary to track column order: {column_name: order}
             self.column_order = {}
 
+            # The column widgets in layout order, kept in step with the layout by
+            # KanbanTabManager so a drag never has to walk the layout items
+            self.columns: list[KanbanColumn] = []
+
+            # While a drag is in progress, the column names in their tentative order
+            # and the order values they occupy, ascending
+            self._order_list = []
+            self._order_values = []
+
+            # Orders of the fixed "Ready to Start" and "Complete" columns, captured
+            # when a drag starts since neither can move during it
+            self._ready_order = None
+            self._complete_order = None
+
+            # Column and layout slot the last move event resolved to, None until the
+            # first one
+            self._drag_target = None
+
+            # Move events are coalesced so the order is recalculated at most once
+            # per frame, with the latest (x position, column name) seen
+            self._pending_drag = None
+            self._drag_timer = QTimer(self)
+            self._drag_timer.setSingleShot(True)
+            self._drag_timer.setInterval(16)
+            self._drag_timer.timeout.connect(self._apply_pending_drag)
+
             # Track the column currently being dragged
             self.dragged_column = None
 
-            # Track column positions (left edge x-coordinate)
+            # Track the horizontal middle of each column, left to right, and the
+            # layout index of each column by name
             self.column_positions = []
+            self._position_index = {}
 
             # Enable dropping
             self.setAcceptDrops(True)
@@ -59,66 +123,40 @@ class KanbanTabManager(QTabWidget):
             # Create layout for columns
             self.column_layout = QHBoxLayout(self)
             self.column_layout.setSpacing(10)
-            self.column_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
+            self.column_layout.setAlignment(_ALIGN_LEFT)
 
             # Setup context menu
             self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
 
-        def refresh_column_order(self):
-            """Refresh the column order dictionary from the database"""
-            if not self.db_manager:
-                print("Cannot refresh column order: no database manager")
-                return
-
-            # Load active columns
-            result = self.db_manager.load_columns()
-            if result.success:
-                # Clear existing order dictionary
-                self.column_order.clear()
-
-                # Get column data which includes (name, number, column_color, text_color)
-                columns = result.data
-
-                # Fetch the actual order values from the database
-                for column_data in columns:
-                    name = column_data[0]  # Name is the first element
-
-                    # Query the database for this column's order
-                    order_query = """
-                    SELECT "Order"
-                    FROM Columns
-                    WHERE Name = ? AND deletion_date IS NULL;
-                    """
-
-                    with self.db_manager.db_manager.connection() as db:
-                        order_result = db.execute_query(order_query, (name,))
-                        if order_result.success and order_result.data.next():
-                            order = order_result.data.value("Order")
-                            self.column_order[name] = order
-                        else:
-                            print(f"Could not find order for column: {name}")
-
-                print(f"Refreshed column order: {self.column_order}")
-            else:
-                print(f"Failed to load columns: {result.message}")
-
         def update_column_positions(self):
-            """Update the positions of columns for drag reference"""
-            self.column_positions = []
+            """Update the positions of columns for drag reference
+
+            The geometry is read once when a drag starts, so each move event only
+            has to binary search the stored midpoints.
 
-            # For each column widget, store its position
-            for i in range(self.column_layout.count()):
-                widget = self.column_layout.itemAt(i).widget()
-                if widget and hasattr(widget, "name"):
-                    # Store the left edge x-coordinate, width, and widget reference
-                    pos = widget.pos().x()
-                    self.column_positions.append((pos, widget.width(), widget))
-                    print(
-                        f"""Added column position:
-                        {widget.name} at x={pos}, width={widget.width()}"""
+            Returns:
+                The names of the columns in layout order, left to right
+            """
+            # Read every column's geometry first, without touching anything else,
+            # into parallel lists of names and geometries
+            names = [column.name for column in self.columns]
+            geometries = [column.geometry() for column in self.columns]
+
+            # Then store the middle of each column's span
+            self.column_positions = [g.x() + g.width() / 2 for g in geometries]
+            self._position_index = dict(zip(names, range(len(names))))
+
+            if self.log and self.log.isEnabledFor(logging.DEBUG):
+                for name, g in zip(names, geometries):
+                    self.log.debug(
+                        "Added column position: %s at x=%d, width=%d",
+                        name,
+                        g.x(),
+                        g.width(),
                     )
+                self.log.debug("Updated column positions: %d columns", len(names))
 
-            print(f"Updated column positions: {len(self.column_positions)} columns")
+            return names
 
         def dragEnterEvent(self, event):
             """Handle drag enter events
@@ -134,23 +172,28 @@ class KanbanTabManager(QTabWidget):
                 column_name = event.mimeData().text()
 
                 # Only accept if it's not a fixed column
-                if column_name not in ["Ready to Start", "Complete"]:
+                if column_name not in self.FIXED_COLUMNS:
                     event.accept()
 
                     # Store the dragged column
                     self.dragged_column = column_name
 
-                    # Save a copy of the original order
-                    self.original_column_order = self.column_order.copy()
-
-                    # Update column positions for reference
-                    self.update_column_positions()
-
-                    print(f"Started dragging column: {column_name}")
-                    print(f"Current order: {self.column_order}")
+                    # Read the column positions and, from the same layout pass, the
+                    # names in display order.  The drag works on that list and leaves
+                    # column_order untouched until the drop, so it is never restored
+                    self._order_list = self.update_column_positions()
+                    self._order_values = sorted(self.column_order.values())
+                    self._ready_order = self.column_order.get("Ready to Start")
+                    self._complete_order = self.column_order.get("Complete")
+                    self._drag_target = self._pending_drag = None
+
+                    if self.log:
+                        self.log.debug("Started dragging column: %s", column_name)
+                        self.log.debug("Current order: %s", self.column_order)
                 else:
                     event.ignore()
-                    print(f"Rejected drag for fixed column: {column_name}")
+                    if self.log:
+                        self.log.debug("Rejected drag for fixed column: %s", column_name)
             else:
                 event.ignore()
 
@@ -168,94 +211,112 @@ class KanbanTabManager(QTabWidget):
                 column_name = event.mimeData().text()
 
                 # Only handle non-fixed columns
-                if column_name not in ["Ready to Start", "Complete"]:
+                if column_name not in self.FIXED_COLUMNS:
                     event.accept()
 
-                    # Calculate new position and update order dictionary
-                    self.calculate_new_order(event.position().x(), column_name)
+                    # Calculate new position and update order dictionary, once the
+                    # frame's worth of move events has arrived
+                    self._pending_drag = (event.position().x(), column_name)
+                    if not self._drag_timer.isActive():
+                        self._drag_timer.start()
                 else:
                     event.ignore()
             else:
                 event.ignore()
 
-        def calculate_new_order(self, x_pos, column_name):  # noqa: C901
+        def _apply_pending_drag(self):
+            """Recalculate the order for the latest coalesced drag move"""
+            if self._pending_drag is not None:
+                pending, self._pending_drag = self._pending_drag, None
+                self.calculate_new_order(*pending)
+
+        def calculate_new_order(self, x_pos, column_name):
             """Calculate the new order for the dragged column
 
+            The orders of the fixed columns are the ones captured when the drag
+            started, and a column missing from the drag's name list is reported
+            rather than treated as having order 0.
+
             Args:
                 x_pos: Current x position of the drag
                 column_name: Name of the column being dragged
             """
-            # Find the position in the layout where the column would be dropped
-            target_index = 0
-
             # Skip if we have no column positions
             if not self.column_positions:
-                print("No column positions available")
+                if self.log:
+                    self.log.debug("No column positions available")
                 return
 
-            # Determine where the column would be inserted based on x position
-            for i, (pos, width, widget) in enumerate(self.column_positions):
-                # If widget is the dragged column, skip it
-                if hasattr(widget, "name") and widget.name == column_name:
-                    continue
+            # Find the position in the layout where the column would be dropped, the
+            # number of columns whose middle lies left of the drag
+            target_index = bisect_left(self.column_positions, x_pos)
 
-                # If past the middle of this column
-                if x_pos > pos + (width / 2):
-                    target_index = i + 1
-                else:
-                    break
+            # Passing only the middle of the dragged column itself does not move it
+            if self._position_index.get(column_name) == target_index - 1:
+                target_index -= 1
 
-            # Find the order of "Ready to Start" and "Complete" columns
-            ready_order = None
-            complete_order = None
-            for name, order in self.column_order.items():
-                if name == "Ready to Start":
-                    ready_order = order
-                elif name == "Complete":
-                    complete_order = order
+            # Most move events stay within the same slot, which changes nothing
+            drag_target = (column_name, target_index)
+            if drag_target == self._drag_target:
+                return
+            self._drag_target = drag_target
 
-            if ready_order is not None and target_index <= ready_order:
-                target_index = ready_order + 1  # Place after "Ready to Start"
-            elif complete_order is not None and target_index >= complete_order:
-                target_index = complete_order - 1  # Place before "Complete"
-
-            # Get current order of the dragged column
-            current_order = self.column_order.get(column_name, 0)
-            if current_order == 0:
-                print(f"Column {column_name} not found in order dictionary")
+            # Keep the column between "Ready to Start" and "Complete"
+            target_index = self._clamp_to_fixed_columns(target_index)
+
+            # Get current position of the dragged column, in a single scan
+            try:
+                current_index = self._order_list.index(column_name)
+            except ValueError:
+                if self.log:
+                    self.log.debug("Column %s not found in order dictionary", column_name)
                 return
 
-            # Calculate new order value
+            # Calculate new position, the slot holding the target order value
             new_order = target_index
+            new_index = bisect_left(self._order_values, new_order)
 
             # Only update if order actually changes
-            if new_order != current_order:
-                print(f"Moving {column_name} from order {current_order} to {new_order}")
-
-                # Update the order dictionary with the new values
-                # Create a working copy so we don't modify while iterating
-                new_order_dict = self.column_order.copy()
-
-                # Adjust all columns between old and new position
-                if new_order > current_order:
-                    # Moving right: Shift columns between old and new position left
-                    for col, order in new_order_dict.items():
-                        if col != column_name and current_order < order <= new_order:
-                            new_order_dict[col] = order - 1
-                else:
-                    # Moving left: Shift columns between new and old position right
-                    for col, order in new_order_dict.items():
-                        if col != column_name and new_order <= order < current_order:
-                            new_order_dict[col] = order + 1
+            if new_index != current_index:
+                # Moving the name shifts every column between the two slots by one
+                self._order_list.pop(current_index)
+                self._order_list.insert(new_index, column_name)
+
+                # Log the changes for debugging, only formatted when DEBUG is on
+                if self.log and self.log.isEnabledFor(logging.DEBUG):
+                    self.log.debug(
+                        "Moving %s from order %d to %d",
+                        column_name,
+                        self._order_values[current_index],
+                        new_order,
+                    )
+                    self.log.debug("Updated order: %s", self._order_list)
+
+        def _clamp_to_fixed_columns(self, target_index):
+            """Keep a drop target between "Ready to Start" and "Complete"
+
+            Args:
+                target_index: Drop target computed from the drag position
 
-                # Set new order for dragged column
-                new_order_dict[column_name] = new_order
+            Returns:
+                The target, moved after "Ready to Start" or before "Complete"
+            """
+            ready_order = self._ready_order
+            complete_order = self._complete_order
+
+            if ready_order is not None and target_index <= ready_order:
+                return ready_order + 1  # Place after "Ready to Start"
+            if complete_order is not None and target_index >= complete_order:
+                return complete_order - 1  # Place before "Complete"
+            return target_index
 
-                # Update the column_order dictionary
-                self.column_order = new_order_dict
+        def calculated_order(self):
+            """Return the order the current drag would give the columns
 
-                # Print the changes for debugging
-                print(f"Updated order: {self.column_order}")
+            Returns:
+                Dictionary of {column_name: order} built from the drag's name list
+            """
+            return dict(zip(self._order_list, self._order_values))
 
         def dropEvent(self, event):
             """Handle drop events
@@ -265,13 +326,21 @@ class KanbanTabManager(QTabWidget):
             Args:
                 event: Drop event
             """
-            # Print the final calculated order for reference
-            print(f"Final calculated order (not persisted): {self.column_order}")
-
-            # Reset to original order
-            if hasattr(self, "original_column_order"):
-                self.column_order = self.original_column_order.copy()
-                print(f"Reset to original order: {self.column_order}")
+            # Account for a move still waiting on the coalescing timer
+            self._drag_timer.stop()
+            self._apply_pending_drag()
+
+            # Log the final calculated order for reference
+            if self.log and self.log.isEnabledFor(logging.DEBUG):
+                self.log.debug(
+                    "Final calculated order (not persisted): %s", self.calculated_order()
+                )
+                self.log.debug("Reset to original order: %s", self.column_order)
+
+            # Discard the drag's order, column_order still holds the original
+            self._order_list = []
+            self._order_values = []
+            self._ready_order = self._complete_order = self._drag_target = None
 
             # Reset dragged column reference
             self.dragged_column = None
@@ -279,13 +348,19 @@ class KanbanTabManager(QTabWidget):
             # Ignore the drop to let the column snap back to original position
             event.ignore()
 
-            print("Drop ignored - column will reset to original position")
+            if self.log:
+                self.log.debug("Drop ignored - column will reset to original position")
 
     """Manages multiple tabs including Kanban board display
 
     Creates and manages tabs for task queue, Kanban board, statistics,
     and blocked tasks. Sets up scrollable container for Kanban columns.
 
+    The task queue, statistics and blocked tabs are bare placeholder widgets with
+    nothing to defer.  The Kanban board is built up front even though Task Queue
+    is the first tab shown, because opening or creating a database fills the
+    board through column_layout whichever tab is current.
+
     Attributes:
         task_queue_tab: Tab for task queue view
         kanban_tab: Tab containing Kanban board
@@ -303,8 +378,12 @@ class KanbanTabManager(QTabWidget):
             parent: Parent widget
         """
         super().__init__(parent)
-        self.db_manager = db_manager
         self.log = log
+        self.db_manager = db_manager
+        # Index of the columns on the board by name.  A column's name is fixed once
+        # its widget is built, renaming goes through a board reload, so entries only
+        # change in populate_columns, insert_column, remove_column and clear_columns
+        self._columns: dict[str, KanbanColumn] = {}
 
         self.task_queue_tab = QWidget()
         self.kanban_tab = QWidget()
@@ -322,57 +401,114 @@ class KanbanTabManager(QTabWidget):
     def update_column(self, name: str, number: int):
         """Update task count for specified column
 
+        The column is found through the name index rather than by walking the
+        layout, so the cost of an update does not grow with the board.  Names not
+        on the board are ignored.
+
         Args:
             name: Name of column to update
             number: New task count
         """
-        for i in range(self.column_layout.count()):
-            column = self.column_layout.itemAt(i).widget()
-            if column.name == name:
-                column.update_task_count(number)
-                break
+        column = self._columns.get(name)
+        if column is not None:
+            column.update_task_count(number)
+
+    # ------------------------------------------------------------------------------------------
+
+    def populate_columns(self, snapshot: list[tuple[str, int, int, str, str]]):
+        """Build the board's columns from a snapshot read from the database
+
+        The snapshot already carries each column's order, so the cached column
+        order is seeded from it instead of being re-read after every column.  As in
+        clear_columns, layout and repaints are suspended until every column is in.
+
+        Args:
+            snapshot: List of (name, order, number, column_color, text_color) tuples
+                in display order
+        """
+        column_order = self.column_container.column_order
+        column_order.clear()
+        with _batched_updates(self.column_container, self.column_layout):
+            for name, order, number, column_color, text_color in snapshot:
+                column = self._create_column_widget(
+                    name, number, column_color, text_color
+                )
+                self.column_layout.addWidget(column)
+                self._columns[name] = column
+                self.column_container.columns.append(column)
+                column_order[name] = order
+
+        if self.log:
+            self.log.info("Added %d Kanban columns", len(snapshot))
 
     # ------------------------------------------------------------------------------------------
 
-    def add_column(
+    def insert_column(
         self,
         name: str,
+        order: int,
         number: int = 0,
         column_color: str = "#b8daff",
         text_color: str = "#000000",
     ):
-        """Add new column to Kanban board
+        """Insert a single newly created column at its place on the board
 
-        Creates a new KanbanColumn widget with specified properties and adds it to
-        the board layout. The column is initialized with the provided colors and
-        connected to the database manager for persistent color updates.
+        The existing columns are left alone and the cached column order is updated
+        in place rather than re-read from the database.
 
         Args:
             name: Column header text
+            order: Order value the column was stored with
             number: Initial task count (defaults to 0)
             column_color: Background color for column header in hex format
-            (defaults to light blue) text_color: Text color for column header in
-            hex format (defaults to black)
-
-        Note:
-            The db_manager property must be set before calling this method for color
-            persistence to work. The database manager is passed to each KanbanColumn
-            to enable direct updates of color changes to the database.
+            text_color: Text color for column header in hex format
         """
-        column = KanbanColumn(
-            name=name,
-            number=number,
-            column_color=column_color,
-            text_color=text_color,
-            parent=self.column_container,
-            db_manager=self.db_manager,
-        )
-        self.column_layout.addWidget(column)
+        column_order = self.column_container.column_order
+        index = sum(1 for value in column_order.values() if value < order)
+
+        column = self._create_column_widget(name, number, column_color, text_color)
+        self.column_layout.insertWidget(index, column)
+        self._columns[name] = column
+        self.column_container.columns.insert(index, column)
+
+        # Columns at or after the new position were shifted right in the database
+        for column_name, value in column_order.items():
+            if value >= order:
+                column_order[column_name] = value + 1
+        column_order[name] = order
+
         if self.log:
-            self.log.info(f"Added Kanban column: {name} with color {column_color}")
+            self.log.info("Inserted Kanban column: %s at position %d", name, index)
+
+    # ------------------------------------------------------------------------------------------
+
+    def remove_column(self, name: str):
+        """Remove a single deleted column from the board
+
+        The counterpart of insert_column, the other columns are left alone and the
+        cached column order is shifted the same way soft_delete_column shifts it in
+        the database.
+
+        Args:
+            name: Name of the deleted column
+        """
+        column = self._columns.pop(name, None)
+        if column is None:
+            return
+        self.column_container.columns.remove(column)
+        column.setParent(None)
+        column.deleteLater()
+
+        # Columns after the removed one moved left in the database, except Complete
+        column_order = self.column_container.column_order
+        order = column_order.pop(name, None)
+        if order is not None:
+            for column_name, value in column_order.items():
+                if value > order and column_name != "Complete":
+                    column_order[column_name] = value - 1
 
-        # Refresh column order after adding a column
-        self.column_container.refresh_column_order()
+        if self.log:
+            self.log.info("Removed Kanban column: %s", name)
 
     # ------------------------------------------------------------------------------------------
 
@@ -395,31 +531,33 @@ class KanbanTabManager(QTabWidget):
             manager: KanbanDatabaseManager instance for column operations
         """
         self._db_manager = manager
-        print(f"Database manager updated: {manager is not None}")
+        if self.log:
+            self.log.debug("Database manager updated: %s", manager is not None)
 
-        # Update column container with new db_manager if it exists
+        # Update column container with new db_manager if it exists, its column
+        # order is seeded by populate_columns when the board is loaded
         if hasattr(self, "column_container"):
             self.column_container.db_manager = manager
-            # Refresh column order with new database
-            if manager is not None:
-                self.column_container.refresh_column_order()
 
     # ------------------------------------------------------------------------------------------
 
     def clear_columns(self):
-        """Remove all columns from the Kanban board"""
-        # Clear all widgets from the column layout
-        while self.column_layout.count():
-            # Get the widget at index 0
-            item = self.column_layout.takeAt(0)
-            if item is not None and item.widget():
-                # Hide and delete the widget
-                widget = item.widget()
-                widget.hide()
-                widget.deleteLater()
-
-        # Force a layout update
-        self.column_layout.update()
+        """Remove all columns from the Kanban board
+
+        The layout and repaints are suspended while the columns are detached, so
+        the board is laid out once rather than once per column.  Detaching a
+        widget removes it from the layout and hides it, so neither takeAt nor
+        hide is needed.  The columns are detached front to back in layout order,
+        so each one is the layout's first item when it is removed and neither the
+        search for it nor its removal has to walk or shift the rest.
+        """
+        columns = self.column_container.columns
+        with _batched_updates(self.column_container, self.column_layout):
+            for column in columns:
+                column.setParent(None)
+                column.deleteLater()
+        self._columns.clear()
+        columns.clear()
 
         if self.log:
             self.log.debug("Cleared all columns from Kanban board")
@@ -437,8 +575,11 @@ class KanbanTabManager(QTabWidget):
         self.scroll = QScrollArea()
         self.scroll.setObjectName("kanbanScrollArea")
         self.scroll.setWidgetResizable(True)
-        self.scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.scroll.setHorizontalScrollBarPolicy(_AS_NEEDED)
+        # AlwaysOff keeps the vertical bar hidden and out of the viewport layout, and
+        # the columns must keep stretching to the viewport height, so neither the bar
+        # nor the container's vertical size policy needs any further tuning
+        self.scroll.setVerticalScrollBarPolicy(_ALWAYS_OFF)
 
         # Use enhanced KanbanColumnContainer with db_manager parameter
         self.column_container = self.KanbanColumnContainer(
@@ -454,6 +595,33 @@ class KanbanTabManager(QTabWidget):
 
     # ------------------------------------------------------------------------------------------
 
+    def _create_column_widget(
+        self, name: str, number: int, column_color: str, text_color: str
+    ) -> KanbanColumn:
+        """Build a KanbanColumn bound to the column container, database manager and
+        this tab manager
+
+        Args:
+            name: Column header text
+            number: Initial task count
+            column_color: Background color for column header in hex format
+            text_color: Text color for column header in hex format
+
+        Returns:
+            The new, not yet laid out, KanbanColumn
+        """
+        return KanbanColumn(
+            name=name,
+            number=number,
+            column_color=column_color,
+            text_color=text_color,
+            parent=self.column_container,
+            db_manager=self.db_manager,
+            tab_manager=self,
+        )
+
+    # ------------------------------------------------------------------------------------------
+
     def _show_context_menu(self, position):
         """Show context menu for column container
 
@@ -477,47 +645,23 @@ class KanbanTabManager(QTabWidget):
                 column_name = dialog.get_column_name()
 
                 try:
-                    # Get the order value (before Complete)
-                    result = self.db_manager.get_order_for_new_column()
-                    if not result.success:
-                        raise Exception(f"Failed to get column order: {result.message}")
-
-                    new_order = result.data
-
-                    # Add the column
-                    result = self.db_manager.add_column(name=column_name, order=new_order)
+                    # Place the column before Complete and insert it in one transaction
+                    result = self.db_manager.create_column_atomic(column_name)
 
                     if result.success:
-                        # Clear existing columns
-                        self.clear_columns()
-
-                        # Reload columns from database
-                        load_result = self.db_manager.load_columns()
-                        if load_result.success:
-                            for (
-                                name,
-                                number,
-                                column_color,
-                                text_color,
-                            ) in load_result.data:
-                                self.add_column(name, number, column_color, text_color)
-
-                            QMessageBox.information(
-                                self,
-                                "Success",
-                                f"Column '{column_name}' created successfully.",
-                            )
-                        else:
-                            raise Exception(
-                                f"Failed to reload columns: {load_result.message}"
-                            )
+                        self.insert_column(column_name, result.data)
+                        QMessageBox.information(
+                            self,
+                            "Success",
+                            f"Column '{column_name}' created successfully.",
+                        )
                     else:
                         QMessageBox.critical(
                             self, "Error", f"Failed to create column: {result.message}"
                         )
 
                 except Exception as e:
-                    self.log.error(f"Error creating column: {str(e)}")
+                    self.log.error("Error creating column: %s", e)
                     QMessageBox.critical(
                         self, "Error", f"Failed to create column: {str(e)}"
                     )
@@ -1,5 +1,8 @@
-from PyQt6.QtCore import QMimeData, Qt
-from PyQt6.QtGui import QColor, QDrag, QPixmap
+from functools import lru_cache
+
+from PyQt6 import sip
+from PyQt6.QtCore import QEvent, QMimeData, Qt, QTimer
+from PyQt6.QtGui import QColor, QDrag, QPainter, QPixmap
 from PyQt6.QtWidgets import (
     QApplication,
     QButtonGroup,
@@ -10,11 +13,12 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QRadioButton,
     QSizePolicy,
-    QTabWidget,
     QVBoxLayout,
     QWidget,
 )
 
+from pykanban.database import FIXED_COLUMNS
+
 # ==========================================================================================
 # ==========================================================================================
 
@@ -28,6 +32,65 @@ from PyQt6.QtWidgets import (
 # ==========================================================================================
 # Insert Code here
 
+# Characters allowed after the # of a hex color
+_HEX_CHARS = frozenset("0123456789ABCDEFabcdef")
+
+
+@lru_cache(maxsize=256)
+def _is_hex_color(color: str) -> bool:
+    """Return True if ``color`` is a "#RRGGBB" or "#AARRGGBB" hex string
+
+    Boards reuse a handful of colors, so results are memoised per string.
+
+    Args:
+        color: Color string to check
+
+    Returns:
+        bool: True if valid hex color, False otherwise
+    """
+    return len(color) in (7, 9) and color[0] == "#" and _HEX_CHARS.issuperset(color[1:])
+
+
+# Colors of a column header; its border, padding and font come from the
+# QWidget#columnHeader rule of the application's theme style sheet
+_HEADER_QSS = "QLabel#columnHeader { background-color: %s; color: %s; }"
+
+
+@lru_cache(maxsize=64)
+def _header_qss(column_color: str, text_color: str) -> str:
+    """Return the header style sheet for a pair of colors
+
+    Columns with the same colors share one string, formatted the first time the
+    pair is seen.
+
+    Args:
+        column_color: Hex color of the header background
+        text_color: Hex color of the header text
+
+    Returns:
+        str: Style sheet for the column header
+    """
+    return _HEADER_QSS % (column_color, text_color)
+
+
+@lru_cache(maxsize=64)
+def _qcolor(color: str) -> QColor:
+    """Return the QColor for a hex color string, parsed once per string
+
+    Callers must not modify the returned color; Qt setters such as
+    QColorDialog.setCurrentColor copy the color they are given.
+
+    Args:
+        color: Hex color string
+
+    Returns:
+        QColor: The parsed color
+    """
+    return QColor(color)
+
+
+# ------------------------------------------------------------------------------------------
+
 
 class DayNightRadioButton(QWidget):
     """
@@ -37,20 +100,21 @@ class DayNightRadioButton(QWidget):
                           if set to false
     """
 
+    DAY_LABEL = "Day"
+    NIGHT_LABEL = "Night"
+
     def __init__(self, active_widget: bool = True):
         super().__init__()
 
         self.form = QHBoxLayout(self)
         self.button_group = QButtonGroup(self)
 
-        self.day_button = QRadioButton("Day")
-        self.night_button = QRadioButton("Night")
+        self.day_button = QRadioButton(self.DAY_LABEL, self)
+        self.night_button = QRadioButton(self.NIGHT_LABEL, self)
 
-        self.form.addWidget(self.day_button)
-        self.form.addWidget(self.night_button)
-
-        self.button_group.addButton(self.day_button)
-        self.button_group.addButton(self.night_button)
+        for button in (self.day_button, self.night_button):
+            self.form.addWidget(button)
+            self.button_group.addButton(button)
 
         # Set the day theme as default
         self.day_button.setChecked(True)
@@ -70,6 +134,8 @@ class KanbanColors:
 
     DEFAULT_HEADER_BG = "#b8daff"  # Light blue background
     DEFAULT_HEADER_TEXT = "#000000"  # Black text
+    # Both defaults as one tuple, built once rather than on every lookup
+    DEFAULT_COLORS = (DEFAULT_HEADER_BG, DEFAULT_HEADER_TEXT)
 
     # ------------------------------------------------------------------------------------------
 
@@ -80,7 +146,7 @@ class KanbanColors:
         Returns:
             tuple: (header_background_color, header_text_color)
         """
-        return (KanbanColors.DEFAULT_HEADER_BG, KanbanColors.DEFAULT_HEADER_TEXT)
+        return KanbanColors.DEFAULT_COLORS
 
     # ------------------------------------------------------------------------------------------
 
@@ -94,16 +160,105 @@ class KanbanColors:
         Returns:
             bool: True if valid hex color, False otherwise
         """
-        if not isinstance(color, str):
-            return False
+        return isinstance(color, str) and _is_hex_color(color)
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+class _HeaderLabel(QLabel):
+    """Column header label that paints a cached image of itself
+
+    The header's styled background, rounded border and text only change with
+    its text, colors or size, so after the first paint they are rendered once
+    into a pixmap that is then copied to the screen on every repaint.
+    """
+
+    def __init__(self, text: str, parent: QWidget = None):
+        super().__init__(text, parent)
+        self._pixmap = None
+        # Set while the label renders itself into the cache, so that paintEvent
+        # draws the real label instead of the cached image
+        self._rendering = False
+        # Set while taking the image is scheduled after a paint
+        self._cache_pending = False
+
+    # ------------------------------------------------------------------------------------------
+
+    def setText(self, text: str):
+        """Set the label's text and discard the cached image
+
+        Args:
+            text: New text of the label
+        """
+        super().setText(text)
+        self._pixmap = None
+
+    # ------------------------------------------------------------------------------------------
+
+    def resizeEvent(self, event):
+        """Discard the cached image, which no longer matches the label's size
 
-        # Check if it's a valid hex color code
-        if not color.startswith("#"):
-            return False
+        Args:
+            event: Resize event object
+        """
+        self._pixmap = None
+        super().resizeEvent(event)
+
+    # ------------------------------------------------------------------------------------------
+
+    def changeEvent(self, event):
+        """Discard the cached image when the label's style sheet, palette or font changes
+
+        Args:
+            event: Change event object
+        """
+        if event.type() in (
+            QEvent.Type.StyleChange,
+            QEvent.Type.PaletteChange,
+            QEvent.Type.FontChange,
+        ):
+            self._pixmap = None
+        super().changeEvent(event)
+
+    # ------------------------------------------------------------------------------------------
+
+    def paintEvent(self, event):
+        """Paint the label from its cached image, or paint it normally and cache it
+
+        Args:
+            event: Paint event object
+        """
+        if self._pixmap is None or self._rendering:
+            super().paintEvent(event)
+            # A widget cannot render itself from inside its own paint event, so
+            # the image is taken once the current paint has finished
+            if not self._rendering and not self._cache_pending:
+                self._cache_pending = True
+                QTimer.singleShot(0, self._cache_image)
+            return
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._pixmap)
+        painter.end()
+
+    # ------------------------------------------------------------------------------------------
 
-        # Remove the # and check if remaining chars are valid hex
-        color = color.lstrip("#")
-        return len(color) in (6, 8) and all(c in "0123456789ABCDEFabcdef" for c in color)
+    def _cache_image(self):
+        """Render the label as it currently looks into the cached image"""
+        # The column may have been deleted before the scheduled call came round
+        if sip.isdeleted(self):
+            return
+        self._cache_pending = False
+        if self._pixmap is not None or not self.isVisible() or not self.parentWidget():
+            return
+        # Taken from the column so that the corners outside the rounded border,
+        # and their anti-aliased edges, match what the column draws behind them
+        self._rendering = True
+        try:
+            self._pixmap = self.parentWidget().grab(self.geometry())
+        finally:
+            self._rendering = False
 
 
 # ==========================================================================================
@@ -113,6 +268,13 @@ class KanbanColors:
 class KanbanColumn(QWidget):
     """A widget representing a single column in a Kanban board"""
 
+    # Columns that always stay first and last and can be neither dragged nor deleted
+    FIXED_COLUMNS = FIXED_COLUMNS
+    # Fixed width, full height; Qt copies the policy into each column it is set on
+    _SIZE_POLICY = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
+    # Color dialog reused by every column, built the first time a color is changed
+    _color_dialog: QColorDialog | None = None
+
     def __init__(
         self,
         name: str,
@@ -121,6 +283,7 @@ class KanbanColumn(QWidget):
         text_color: str = KanbanColors.DEFAULT_HEADER_TEXT,
         parent: QWidget = None,
         db_manager=None,
+        tab_manager=None,
     ):
         """Initialize the Kanban column
 
@@ -131,14 +294,35 @@ class KanbanColumn(QWidget):
             text_color: Text color for header
             parent: Parent widget (optional)
             db_manager: Database manager instance
+            tab_manager: KanbanTabManager showing the column, which is told when
+                the column is deleted (optional)
         """
         super().__init__(parent)
 
         self.name = name
+        self.is_fixed = name in self.FIXED_COLUMNS
         self.number = number
         self._column_color = column_color
         self._text_color = text_color
         self.db_manager = db_manager
+        # The database manager's logger, bound once for the event handlers
+        self._log = getattr(db_manager, "log", None)
+        self.tab_manager = tab_manager
+        # Colors the header style sheet was last built from, None before the first
+        self._style_key = None
+        # Set while the column is hidden and its header text or style is out of date
+        self._text_dirty = False
+        self._style_dirty = False
+        # Set while a header text refresh is scheduled for the next event loop pass
+        self._text_pending = False
+        # Fixed start of the header text, which only the task count follows
+        self._header_prefix = f"{name} / "
+        # Image shown under the cursor while the column is dragged, rendered on the
+        # first drag and kept until the column's size or appearance changes
+        self._drag_pixmap = None
+        # Right-click menu built on first use, and the handler of each of its actions
+        self._context_menu = None
+        self._menu_handlers = {}
 
         # Flag to indicate if the column is currently being dragged
         self.dragging = False
@@ -146,6 +330,8 @@ class KanbanColumn(QWidget):
         self.initial_position = None
         # Original column index for restoring position if drag is not committed
         self.original_index = None
+        # Distance in pixels the mouse must travel before a press becomes a drag
+        self._drag_threshold = QApplication.startDragDistance()
 
         # Enable right-click menu
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -172,7 +358,7 @@ class KanbanColumn(QWidget):
         Args:
             color: New color in hex format (#RRGGBB)
         """
-        if KanbanColors.validate_color(color):
+        if color != self._column_color and KanbanColors.validate_color(color):
             self._column_color = color
             self._update_header_style()
 
@@ -192,7 +378,7 @@ class KanbanColumn(QWidget):
         Args:
             color: New color in hex format (#RRGGBB)
         """
-        if KanbanColors.validate_color(color):
+        if color != self._text_color and KanbanColors.validate_color(color):
             self._text_color = color
             self._update_header_style()
 
@@ -200,8 +386,30 @@ class KanbanColumn(QWidget):
 
     def update_task_count(self, number: int):
         """Update the number of tasks shown in column header"""
+        # The same count would only dirty the header label and the drag image
+        if number == self.number:
+            return
         self.number = number
-        self.header.setText(f"{self.name} / {self.number}")
+        # A column on a hidden tab is brought up to date when it is next shown
+        if not self.isVisible():
+            self._text_dirty = True
+            return
+        # Counts changed several times in one pass of the event loop are shown once
+        if not self._text_pending:
+            self._text_pending = True
+            QTimer.singleShot(0, self._refresh_header_text)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _refresh_header_text(self):
+        """Show the current task count in the column header"""
+        # The column may have been deleted before the scheduled call came round
+        if sip.isdeleted(self):
+            return
+        self._text_pending = False
+        self._text_dirty = False
+        self.header.setText(self._header_prefix + str(self.number))
+        self._drag_pixmap = None
 
     # ------------------------------------------------------------------------------------------
 
@@ -213,7 +421,7 @@ class KanbanColumn(QWidget):
         """
         if event.button() == Qt.MouseButton.LeftButton:
             # Only allow dragging of non-fixed columns
-            if self.name in ["Ready to Start", "Complete"]:
+            if self.is_fixed:
                 # Ignore drag for fixed columns
                 event.ignore()
                 return
@@ -226,11 +434,9 @@ class KanbanColumn(QWidget):
             self.drag_start_position = event.pos()
 
             # Find index of this column in its parent layout
-            parent_layout = self.parent().layout()
-            for i in range(parent_layout.count()):
-                if parent_layout.itemAt(i).widget() == self:
-                    self.original_index = i
-                    break
+            index = self._layout_index()
+            if index >= 0:
+                self.original_index = index
 
             event.accept()
         else:
@@ -238,6 +444,26 @@ class KanbanColumn(QWidget):
 
     # ------------------------------------------------------------------------------------------
 
+    def _layout_index(self) -> int:
+        """Return this column's position on the board, or -1 if it is not on it
+
+        The tab manager keeps its columns in layout order, so the position is
+        found in that list without a call into Qt; a column created without a
+        tab manager falls back to a single ``indexOf`` lookup on its parent
+        layout.
+
+        Returns:
+            int: Index of this column in its parent layout, or -1
+        """
+        if self.tab_manager is not None:
+            try:
+                return self.tab_manager.column_container.columns.index(self)
+            except ValueError:
+                return -1
+        return self.parent().layout().indexOf(self)
+
+    # ------------------------------------------------------------------------------------------
+
     def mouseMoveEvent(self, event):
         """Handle mouse move events for drag and drop
 
@@ -249,9 +475,10 @@ class KanbanColumn(QWidget):
             return
 
         # Check if we've moved far enough to start a drag
-        if (
-            event.pos() - self.drag_start_position
-        ).manhattanLength() < QApplication.startDragDistance():
+        pos = event.pos()
+        dx = pos.x() - self.drag_start_position.x()
+        dy = pos.y() - self.drag_start_position.y()
+        if abs(dx) + abs(dy) < self._drag_threshold:
             event.accept()
             return
 
@@ -261,18 +488,19 @@ class KanbanColumn(QWidget):
         mime_data.setText(self.name)
         drag.setMimeData(mime_data)
 
-        # Create a pixmap of this widget for the drag image
-        pixmap = QPixmap(self.size())
-        self.render(pixmap)
-        drag.setPixmap(pixmap)
+        # Create a pixmap of this widget for the drag image, reused between drags
+        if self._drag_pixmap is None:
+            self._drag_pixmap = QPixmap(self.size())
+            self.render(self._drag_pixmap)
+        drag.setPixmap(self._drag_pixmap)
         drag.setHotSpot(event.pos())
 
         # Make us semi-transparent during the drag
         self.setWindowOpacity(0.5)
 
         # Log the start of drag
-        if self.db_manager and self.db_manager.log:
-            self.db_manager.log.debug(f"Started dragging column: {self.name}")
+        if self._log:
+            self._log.debug("Started dragging column: %s", self.name)
 
         # Execute drag and handle result (we only care about the fact that
         # the drag finished, since we're not actually moving the column)
@@ -283,8 +511,8 @@ class KanbanColumn(QWidget):
         self.dragging = False
 
         # Log the end of drag
-        if self.db_manager and self.db_manager.log:
-            self.db_manager.log.debug(f"Finished dragging column: {self.name}")
+        if self._log:
+            self._log.debug("Finished dragging column: %s", self.name)
 
         # Reset to original position since we're not persisting changes
         if self.initial_position:
@@ -294,6 +522,43 @@ class KanbanColumn(QWidget):
 
     # ------------------------------------------------------------------------------------------
 
+    def showEvent(self, event):
+        """Apply header changes made while the column was hidden
+
+        Args:
+            event: Show event object
+        """
+        if self._text_dirty:
+            self._refresh_header_text()
+        if self._style_dirty:
+            self._update_header_style()
+        super().showEvent(event)
+
+    # ------------------------------------------------------------------------------------------
+
+    def resizeEvent(self, event):
+        """Discard the cached drag image, which no longer matches the column's size
+
+        Args:
+            event: Resize event object
+        """
+        self._drag_pixmap = None
+        super().resizeEvent(event)
+
+    # ------------------------------------------------------------------------------------------
+
+    def changeEvent(self, event):
+        """Discard the cached drag image when the theme changes the column's look
+
+        Args:
+            event: Change event object
+        """
+        if event.type() in (QEvent.Type.StyleChange, QEvent.Type.PaletteChange):
+            self._drag_pixmap = None
+        super().changeEvent(event)
+
+    # ------------------------------------------------------------------------------------------
+
     def mouseReleaseEvent(self, event):
         """Handle mouse release events
 
@@ -318,42 +583,56 @@ class KanbanColumn(QWidget):
         Args:
             position: Mouse position where menu should appear
         """
+        # The menu is built on the first right click and reused afterwards
+        if self._context_menu is None:
+            self._build_context_menu()
+
+        # Show the menu at the mouse position and get selected action
+        action = self._context_menu.exec(self.mapToGlobal(position))
+
+        # Handle the selected action
+        handler = self._menu_handlers.get(action)
+        if handler is not None:
+            handler()
+
+    # ------------------------------------------------------------------------------------------
+
+    def _build_context_menu(self):
+        """Build the right-click menu and record the handler of each action"""
         # Create the main context menu
         context_menu = QMenu(self)
 
         # Create "Column Colors" submenu
-        color_menu = QMenu("Column Colors", self)
+        color_menu = QMenu("Column Colors", context_menu)
 
         # Add color options to the submenu
         header_action = color_menu.addAction("Header Color")
         text_action = color_menu.addAction("Text Color")
+        self._menu_handlers = {
+            header_action: self._change_header_color,
+            text_action: self._change_text_color,
+        }
 
         # Add the color submenu to main context menu
         context_menu.addMenu(color_menu)
 
         # Add delete option only for non-fixed columns
-        if self.name not in ["Ready to Start", "Complete"]:
+        if not self.is_fixed:
             context_menu.addSeparator()  # Add visual separator
             delete_action = context_menu.addAction("Delete Column")
-        else:
-            delete_action = None
+            self._menu_handlers[delete_action] = self._delete_column
 
-        # Show the menu at the mouse position and get selected action
-        action = context_menu.exec(self.mapToGlobal(position))
-
-        # Handle the selected action
-        if action == header_action:
-            self._change_header_color()
-        elif action == text_action:
-            self._change_text_color()
-        elif action == delete_action:
-            self._delete_column()
+        self._context_menu = context_menu
 
     # ------------------------------------------------------------------------------------------
 
     def _delete_column(self):
-        """Delete this column if it's not a fixed column"""
-        if self.name in ["Ready to Start", "Complete"]:
+        """Delete this column if it's not a fixed column
+
+        Only this column's widget is taken off the board, through its tab manager,
+        the other columns are left as they are rather than reloaded.
+        """
+        if self.is_fixed:
             return
 
         # Confirm deletion with user
@@ -370,29 +649,9 @@ class KanbanColumn(QWidget):
                 # Attempt to delete the column
                 result = self.db_manager.soft_delete_column(self.name)
                 if result.success:
-                    # Find the parent KanbanTabManager
-                    parent = self.parent()
-                    while parent and not isinstance(parent, QTabWidget):
-                        parent = parent.parent()
-
-                    # Refresh the board if we found the tab manager
-                    if parent and hasattr(parent, "db_manager"):
-                        parent.clear_columns()
-                        load_result = self.db_manager.load_columns()
-                        if load_result.success:
-                            for (
-                                name,
-                                number,
-                                column_color,
-                                text_color,
-                            ) in load_result.data:
-                                parent.add_column(name, number, column_color, text_color)
-                        else:
-                            QMessageBox.critical(
-                                self,
-                                "Error",
-                                f"Failed to reload columns: {load_result.message}",
-                            )
+                    # Take this column off the board
+                    if self.tab_manager is not None:
+                        self.tab_manager.remove_column(self.name)
                 else:
                     QMessageBox.critical(
                         self, "Error", f"Failed to delete column: {result.message}"
@@ -400,12 +659,35 @@ class KanbanColumn(QWidget):
 
     # ------------------------------------------------------------------------------------------
 
+    def _pick_color(self, current: str, title: str) -> QColor:
+        """Let the user pick a color in the color dialog shared by all columns
+
+        The dialog is built on first use and kept, parented to the main window so
+        that it outlives any one column.
+
+        Args:
+            current: Hex color the dialog starts on
+            title: Window title of the dialog
+
+        Returns:
+            QColor: The chosen color, or an invalid QColor if the dialog was canceled
+        """
+        dialog = KanbanColumn._color_dialog
+        if dialog is None or sip.isdeleted(dialog):
+            dialog = KanbanColumn._color_dialog = QColorDialog(self.window())
+        dialog.setCurrentColor(_qcolor(current))
+        dialog.setWindowTitle(title)
+        if dialog.exec() != QColorDialog.DialogCode.Accepted:
+            return QColor()
+        return dialog.currentColor()
+
+    # ------------------------------------------------------------------------------------------
+
     def _change_header_color(self):
         """Open color dialog for header background color"""
-        color = QColorDialog.getColor(
-            QColor(self._column_color), self, "Select Header Color"
-        )
-        if color.isValid():
+        color = self._pick_color(self._column_color, "Select Header Color")
+        # Reselecting the current color changes nothing, on screen or in the database
+        if color.isValid() and color.name() != self._column_color.lower():
             new_color = color.name()
             self.column_color = new_color
             # Update database
@@ -414,21 +696,23 @@ class KanbanColumn(QWidget):
                     self.name, "ColumnColor", new_color
                 )
                 if result.success:
-                    self.db_manager.log.info(
-                        f"Column '{self.name}' header color changed to {new_color}"
+                    self._log.info(
+                        "Column '%s' header color changed to %s", self.name, new_color
                     )
                 else:
-                    self.db_manager.log.error(
-                        f"""Failed to update header color for column
-                    '{self.name}': {result.message}"""
+                    self._log.error(
+                        "Failed to update header color for column '%s': %s",
+                        self.name,
+                        result.message,
                     )
 
     # ------------------------------------------------------------------------------------------
 
     def _change_text_color(self):
         """Open color dialog for header text color"""
-        color = QColorDialog.getColor(QColor(self._text_color), self, "Select Text Color")
-        if color.isValid():
+        color = self._pick_color(self._text_color, "Select Text Color")
+        # Reselecting the current color changes nothing, on screen or in the database
+        if color.isValid() and color.name() != self._text_color.lower():
             new_color = color.name()
             self.text_color = new_color
             # Update database
@@ -437,31 +721,38 @@ class KanbanColumn(QWidget):
                     self.name, "TextColor", new_color
                 )
                 if result.success:
-                    self.db_manager.log.info(
-                        f"Column '{self.name}' text color changed to {new_color}"
+                    self._log.info(
+                        "Column '%s' text color changed to %s", self.name, new_color
                     )
                 else:
-                    self.db_manager.log.error(
-                        f"""Failed to update text color for column
-                        '{self.name}': {result.message}"""
+                    self._log.error(
+                        "Failed to update text color for column '%s': %s",
+                        self.name,
+                        result.message,
                     )
 
     # ------------------------------------------------------------------------------------------
 
     def _update_header_style(self):
-        """Update the header's style sheet with current colors"""
-        style = f"""
-            QLabel#columnHeader {{
-                background-color: {self._column_color};
-                color: {self._text_color};
-                border: 1px solid #dcdcdc;
-                border-radius: 15px;
-                padding: 4px;
-                font-size: 14px;
-                font-weight: bold;
-            }}
+        """Update the header's style sheet with current colors
+
+        Setting a style sheet makes Qt parse it and restyle the header, so nothing
+        is set when the colors are the ones already applied.
+
+        The colors stay in a sheet on the header itself rather than in one board
+        sheet with a rule per column: they are picked freely by the user, and
+        changing a rule of a shared sheet would restyle every column on the board.
         """
-        self.header.setStyleSheet(style)
+        style_key = (self._column_color, self._text_color)
+        if style_key == self._style_key:
+            return
+        if not self.isVisible():
+            self._style_dirty = True
+            return
+        self._style_dirty = False
+        self._style_key = style_key
+        self.header.setStyleSheet(_header_qss(*style_key))
+        self._drag_pixmap = None
 
     # ------------------------------------------------------------------------------------------
 
@@ -477,14 +768,18 @@ class KanbanColumn(QWidget):
         layout.setSpacing(5)
 
         self.setFixedWidth(300)
-        self.header = QLabel(f"{self.name} / {self.number}")
+        self.header = _HeaderLabel(self._header_prefix + str(self.number))
         self.header.setObjectName("columnHeader")
+        # Column names are shown as typed, and Qt skips its rich text detection
+        self.header.setTextFormat(Qt.TextFormat.PlainText)
         self.header.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.header.setFixedHeight(40)
 
         # Apply initial header styling
         self._update_header_style()
 
+        # Tasks sit directly in this container rather than in a per-column scroll
+        # area; scrolling is left to the board's single scroll area
         self.task_container = QWidget()
         self.task_container.setObjectName("columnTaskContainer")
         self.task_container.setProperty(
@@ -498,7 +793,7 @@ class KanbanColumn(QWidget):
         layout.addWidget(self.header)
         layout.addWidget(self.task_container)
 
-        self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
+        self.setSizePolicy(self._SIZE_POLICY)
 
 
 # ==========================================================================================
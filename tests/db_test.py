@@ -1,9 +1,11 @@
+import logging
 import os
 
 import pytest
 from PyQt6.QtWidgets import QApplication
 
-from pykanban.database import DatabaseStatus, SQLiteManager
+from pykanban.database import DatabaseStatus, KanbanDatabaseManager, SQLiteManager
+from pykanban.main import KanbanControllerManager
 
 # ==========================================================================================
 # ==========================================================================================
@@ -40,13 +42,84 @@ def temp_db_path(tmp_path):
 
 
 @pytest.fixture
-def db_manager(qapp, temp_db_path):
-    """Create a database manager instance"""
+def db_manager(qapp):
+    """Create a database manager instance on an in-memory database
+
+    Each test gets its own manager so tests cannot see each other's tables, and
+    nothing touches the disk.
+    """
+    manager = SQLiteManager(":memory:")
+    yield manager
+    manager.remove_db()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.fixture
+def disk_db_manager(qapp, temp_db_path):
+    """Create a database manager instance on a database file
+
+    pytest clears the file away with its temporary directories.
+    """
     manager = SQLiteManager(temp_db_path)
     yield manager
     manager.remove_db()
-    if os.path.exists(temp_db_path):
-        os.remove(temp_db_path)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.fixture
+def initialized_kanban_db(qapp, temp_db_path):
+    """Create a Kanban database manager on a freshly initialized database
+
+    Yields the manager together with the result of initialize_database.
+    """
+    manager = KanbanDatabaseManager(temp_db_path, logging.getLogger("db_test"))
+    result = manager.initialize_database()
+    assert result.success is True
+    yield manager, result
+    manager.close()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.fixture
+def kanban_db(initialized_kanban_db):
+    """Create a Kanban database manager on a freshly initialized database"""
+    manager, _ = initialized_kanban_db
+    return manager
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.fixture
+def controller(qapp, kanban_db):
+    """Create an application controller showing the Kanban database's board"""
+    sheets = os.path.join(os.path.dirname(__file__), "..", "data", "style_sheets")
+    manager = KanbanControllerManager(
+        os.path.join(sheets, "day.qss"),
+        os.path.join(sheets, "night.qss"),
+        logging.getLogger("db_test"),
+    )
+    manager.kanban_db = kanban_db
+    yield manager
+    # The kanban_db fixture closes the database itself
+    manager.kanban_db = None
+    manager.close()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def column_orders(kanban_db) -> dict[str, int]:
+    """Return the order of every active column on the board by name"""
+    result = kanban_db.fetch_board_snapshot()
+    assert result.success is True
+    return {name: order for name, order, *_ in result.data}
 
 
 # ==========================================================================================
@@ -61,15 +134,46 @@ def test_open_close_db(db_manager):
     assert result.success is True
     assert result.data == DatabaseStatus.OPEN
 
-    # Test reopening (should fail)
+    # Test reopening (nests on the open connection, each call gets its own result)
     result = db_manager.open_db()
-    assert result.success is False
+    assert result.success is True
+    assert result.data == DatabaseStatus.OPEN
+    assert db_manager.open_db() is not result
+    db_manager.close_db()
+
+    # Test closing the nested open (connection stays open)
+    result = db_manager.close_db()
+    assert result.success is True
+    assert result.data == DatabaseStatus.OPEN
 
     # Test closing
     result = db_manager.close_db()
     assert result.success is True
     assert result.data == DatabaseStatus.CLOSED
 
+    # Test closing again (should fail)
+    result = db_manager.close_db()
+    assert result.success is False
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def test_nested_connection(db_manager):
+    """Test that an inner connection block leaves the outer one open"""
+    with db_manager.connection():
+        with db_manager.connection():
+            result = db_manager.safe_execute_query("SELECT 1")
+            assert result.success is True
+
+        # Outer connection should still be usable
+        result = db_manager.safe_execute_query("SELECT 1")
+        assert result.success is True
+
+    result = db_manager.execute_query("SELECT 1")
+    assert result.success is False
+    assert result.data == DatabaseStatus.CLOSED
+
 
 # ------------------------------------------------------------------------------------------
 
@@ -122,30 +226,75 @@ def test_execute_query(db_manager):
 # ------------------------------------------------------------------------------------------
 
 
-def test_transaction_handling(db_manager):
-    """Test transaction management"""
+def test_execute_batch(db_manager):
+    """Test executing one statement for many parameter rows"""
     with db_manager.connection():
-        # Create table
         db_manager.create_table(
+            "batch", ["id", "name", "value"], ["INTEGER PRIMARY KEY", "TEXT", "INTEGER"]
+        )
+
+        begin_result = db_manager.begin_transaction()
+        assert begin_result.success is True
+
+        rows = [("a", 1), ("b", 2), ("c", 3)]
+        batch_result = db_manager.execute_batch(
+            "INSERT INTO batch (name, value) VALUES (?, ?)", rows
+        )
+        assert batch_result.success is True
+
+        commit_result = db_manager.commit_transaction()
+        assert commit_result.success is True
+
+        select_result = db_manager.safe_execute_query(
+            "SELECT name, value FROM batch ORDER BY id"
+        )
+        assert select_result.success is True
+        query = select_result.data
+        fetched = []
+        while query.next():
+            fetched.append((query.value("name"), query.value("value")))
+        assert fetched == rows
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def test_transaction_handling(disk_db_manager):
+    """Test transaction management"""
+    with disk_db_manager.connection():
+        # Create table
+        disk_db_manager.create_table(
             "transactions", ["id", "value"], ["INTEGER PRIMARY KEY", "INTEGER"]
         )
 
         # Start transaction
-        begin_result = db_manager.begin_transaction()
+        begin_result = disk_db_manager.begin_transaction()
         assert begin_result.success is True
 
         # Execute query within transaction
-        insert_result = db_manager.execute_query(
+        insert_result = disk_db_manager.execute_query(
             "INSERT INTO transactions (value) VALUES (?)", (42,)
         )
         assert insert_result.success is True
 
+        # Insert many rows with one prepared statement in the same transaction
+        batch_result = disk_db_manager.execute_batch(
+            "INSERT INTO transactions (value) VALUES (?)", [(i,) for i in range(1000)]
+        )
+        assert batch_result.success is True
+
         # Commit transaction
-        commit_result = db_manager.commit_transaction()
+        commit_result = disk_db_manager.commit_transaction()
         assert commit_result.success is True
 
+        count_result = disk_db_manager.safe_execute_query(
+            "SELECT COUNT(*) FROM transactions"
+        )
+        assert count_result.data.next() is True
+        assert count_result.data.value(0) == 1001
+
         # Verify data was saved
-        select_result = db_manager.safe_execute_query(
+        select_result = disk_db_manager.safe_execute_query(
             "SELECT value FROM transactions WHERE value = ?", (42,)
         )
         assert select_result.success is True
@@ -157,6 +306,93 @@ def test_transaction_handling(db_manager):
 # ------------------------------------------------------------------------------------------
 
 
+def test_safe_execute_query_autocommit(disk_db_manager, temp_db_path, monkeypatch):
+    """Test that single statements autocommit and scripts run in one transaction"""
+    calls = []
+
+    def spy(name):
+        method = getattr(disk_db_manager, name)
+
+        def wrapper():
+            calls.append(name)
+            return method()
+
+        return wrapper
+
+    for name in ("begin_transaction", "commit_transaction", "rollback_transaction"):
+        monkeypatch.setattr(disk_db_manager, name, spy(name))
+
+    reader = SQLiteManager(temp_db_path)
+    try:
+        with disk_db_manager.connection(), reader.connection():
+            disk_db_manager.create_table(
+                "autocommit", ["id", "value"], ["INTEGER PRIMARY KEY", "INTEGER"]
+            )
+            calls.clear()
+
+            # A lone statement skips BEGIN/COMMIT and is visible to other connections
+            insert_result = disk_db_manager.safe_execute_query(
+                "INSERT INTO autocommit (value) VALUES (?);", (1,)
+            )
+            assert insert_result.success is True
+            assert calls == []
+            assert disk_db_manager._tx_depth == 0
+
+            count_result = reader.execute_query("SELECT COUNT(*) FROM autocommit")
+            assert count_result.data.next() is True
+            assert count_result.data.value(0) == 1
+            count_result.data.finish()
+
+            # A script is wrapped in one transaction, so it lands all or nothing
+            script_result = disk_db_manager.safe_execute_query(
+                "INSERT INTO autocommit (value) VALUES (2); "
+                "INSERT INTO autocommit (value) VALUES (3);"
+            )
+            assert script_result.success is False
+            assert calls == ["begin_transaction", "rollback_transaction"]
+            assert disk_db_manager._tx_depth == 0
+
+            count_result = reader.execute_query("SELECT COUNT(*) FROM autocommit")
+            assert count_result.data.next() is True
+            assert count_result.data.value(0) == 1
+    finally:
+        reader.remove_db()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def test_nested_transaction(db_manager):
+    """Test that nested transactions commit and roll back with the outermost one"""
+    with db_manager.connection():
+        db_manager.create_table(
+            "nested", ["id", "value"], ["INTEGER PRIMARY KEY", "INTEGER"]
+        )
+
+        with db_manager.transaction():
+            assert db_manager.begin_transaction().success is True
+            db_manager.execute_query("INSERT INTO nested (value) VALUES (?)", (1,))
+            assert db_manager.commit_transaction().success is True
+            db_manager.execute_query("INSERT INTO nested (value) VALUES (?)", (2,))
+
+        result = db_manager.safe_execute_query("SELECT COUNT(*) FROM nested")
+        assert result.data.next() is True
+        assert result.data.value(0) == 2
+
+        with pytest.raises(RuntimeError):
+            with db_manager.transaction():
+                db_manager.begin_transaction()
+                db_manager.execute_query("INSERT INTO nested (value) VALUES (?)", (3,))
+                db_manager.rollback_transaction()
+
+        result = db_manager.safe_execute_query("SELECT COUNT(*) FROM nested")
+        assert result.data.next() is True
+        assert result.data.value(0) == 2
+
+
+# ------------------------------------------------------------------------------------------
+
+
 def test_schema_operations(db_manager):
     """Test schema-related operations"""
     with db_manager.connection():
@@ -202,6 +438,134 @@ def test_error_handling(db_manager):
         assert result.success is False
 
 
+# ------------------------------------------------------------------------------------------
+
+
+def test_create_columns_atomic(kanban_db):
+    """Test that new columns take Complete's place and Complete moves past them"""
+    complete_order = column_orders(kanban_db)["Complete"]
+
+    result = kanban_db.create_columns_atomic(["Review", "Testing"])
+    assert result.success is True
+    assert result.data == [complete_order, complete_order + 1]
+
+    orders = column_orders(kanban_db)
+    assert orders["Review"] == complete_order
+    assert orders["Testing"] == complete_order + 1
+    assert orders["Complete"] == complete_order + 2
+
+    result = kanban_db.create_column_atomic("Blocked")
+    assert result.success is True
+    assert result.data == complete_order + 2
+    assert column_orders(kanban_db)["Complete"] == complete_order + 3
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def test_create_columns_atomic_rolls_back(kanban_db):
+    """Test that a failed insert leaves the board as it was"""
+    before = column_orders(kanban_db)
+
+    # "In Progress" already exists, so the second insert breaks the unique name index
+    result = kanban_db.create_columns_atomic(["Review", "In Progress"])
+    assert result.success is False
+    assert "UNIQUE" in result.message
+    assert column_orders(kanban_db) == before
+
+    result = kanban_db.create_column_atomic("In Progress")
+    assert result.success is False
+    assert column_orders(kanban_db) == before
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def test_create_columns_atomic_rejects_empty_names(kanban_db):
+    """Test that empty names are refused before anything is written"""
+    before = column_orders(kanban_db)
+
+    assert kanban_db.create_column_atomic("").success is False
+    assert kanban_db.create_columns_atomic([]).success is False
+    assert kanban_db.create_columns_atomic(["Review", ""]).success is False
+    assert column_orders(kanban_db) == before
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def test_fetch_board_snapshot(initialized_kanban_db):
+    """Test that a new board reports the same columns the snapshot reads back"""
+    kanban_db, init_result = initialized_kanban_db
+
+    snapshot_result = kanban_db.fetch_board_snapshot()
+    assert snapshot_result.success is True
+    assert snapshot_result.data == init_result.data
+
+    names = [name for name, *_ in snapshot_result.data]
+    assert names[0] == "Ready to Start"
+    assert names[-1] == "Complete"
+    orders = [order for _, order, *_ in snapshot_result.data]
+    assert orders == sorted(orders)
+    for row in snapshot_result.data:
+        assert len(row) == 5
+
+    # Soft-deleted columns stay in the table but are left off the board
+    assert kanban_db.soft_delete_column("In Progress").success is True
+    snapshot_result = kanban_db.fetch_board_snapshot()
+    assert snapshot_result.success is True
+    assert snapshot_result.data == [
+        row for row in init_result.data if row[0] != "In Progress"
+    ]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def test_deferred_open(kanban_db, temp_db_path):
+    """Test that a deferred open only touches the file on first use"""
+    manager = KanbanDatabaseManager(temp_db_path, logging.getLogger("db_test"))
+    try:
+        assert manager.open(defer=True).success is True
+        assert manager._db_manager._open is False
+
+        # The first operation opens the connection and keeps it held
+        assert manager.fetch_board_snapshot().success is True
+        assert manager._db_manager._open is True
+        journal_result = manager.db_manager.execute_query("PRAGMA journal_mode")
+        assert journal_result.data.next() is True
+        assert journal_result.data.value(0) == "wal"
+    finally:
+        manager.close()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def test_load_kanban_board_reads_snapshot_once(controller, kanban_db, monkeypatch):
+    """Test that loading the board queries the database at most once"""
+    calls = []
+    fetch_board_snapshot = kanban_db.fetch_board_snapshot
+
+    def counting_fetch():
+        calls.append(None)
+        return fetch_board_snapshot()
+
+    monkeypatch.setattr(kanban_db, "fetch_board_snapshot", counting_fetch)
+
+    # Without a snapshot the board is read once
+    controller.load_kanban_board()
+    assert len(calls) == 1
+    orders = controller.tabs.column_container.column_order
+    assert orders == {name: order for name, order, *_ in fetch_board_snapshot().data}
+
+    # A snapshot handed over by the caller is drawn without another query
+    snapshot = fetch_board_snapshot().data
+    controller.load_kanban_board(snapshot)
+    assert len(calls) == 1
+    assert controller.tabs.column_container.column_order == orders
+
+
 # ==========================================================================================
 # ==========================================================================================
 # eof